@@ -10,12 +10,22 @@ from functools import lru_cache
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///./avenir.db"
+    POOL_SIZE: int = 20  # Persistent connections kept open (non-SQLite only)
+    MAX_OVERFLOW: int = 20  # Extra connections allowed under burst load
+    POOL_RECYCLE_SECONDS: int = 1800  # Recycle before server-side idle timeouts
+    POOL_TIMEOUT_SECONDS: int = 30
+    # Disable for multi-worker deployments and run `python -m app.prestart` once instead
+    RUN_MIGRATIONS_ON_STARTUP: bool = True
 
     # JWT
     SECRET_KEY: str = "avenir-super-secret-key-change-in-production-2026"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours
 
+    # Password hashing work factors (raise on faster hardware, lower for tests)
+    ARGON2_TIME_COST: int = 2
+    ARGON2_MEMORY_COST_KIB: int = 19456  # 19 MiB
+
     # Overpass API
     OVERPASS_API_URL: str = "https://overpass-api.de/api/interpreter"
     CACHE_TTL_HOURS: int = 24  # Cache infrastructure data for 24 hours
@@ -29,6 +39,7 @@ class Settings(BaseSettings):
     }
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """Process-wide singleton Settings instance."""
     return Settings()
@@ -4,9 +4,12 @@ Designed for SQLite in dev, PostgreSQL in production.
 """
 
 import os
+import threading
+from contextvars import ContextVar
 from sqlalchemy import create_engine
 from sqlalchemy.engine.url import make_url
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.orm import sessionmaker, scoped_session, declarative_base
+from sqlalchemy.pool import StaticPool
 from app.config import get_settings
 
 settings = get_settings()
@@ -16,24 +19,79 @@ DATABASE_URL = os.environ.get("DATABASE_URL") or settings.DATABASE_URL
 url_obj = make_url(DATABASE_URL)
 
 if url_obj.drivername.startswith("sqlite"):
-    connect_args = {"check_same_thread": False}
+    engine_kwargs = {"connect_args": {"check_same_thread": False}}
+    # In-memory databases live inside a single connection, so share it
+    if url_obj.database in (None, "", ":memory:"):
+        engine_kwargs["poolclass"] = StaticPool
 else:
-    connect_args = {}
+    # Long-lived pool for PostgreSQL: pre-ping drops stale connections,
+    # recycle keeps us ahead of server-side idle timeouts.
+    engine_kwargs = {
+        "connect_args": {},
+        "pool_size": settings.POOL_SIZE,
+        "max_overflow": settings.MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.POOL_RECYCLE_SECONDS,
+        "pool_timeout": settings.POOL_TIMEOUT_SECONDS,
+    }
 
 engine = create_engine(
     DATABASE_URL,
-    connect_args=connect_args,
     echo=False,
+    **engine_kwargs,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# ─── Scoped session registry ───
+# Sync dependencies and endpoints run on arbitrary threadpool workers, so a
+# plain thread-local scope would leak sessions between requests. The scope is
+# keyed by a per-request context var (set by the HTTP middleware in main.py)
+# and falls back to the thread for scripts and startup code.
+_request_scope: ContextVar[int | None] = ContextVar("db_request_scope", default=None)
+
+
+def _scope_key() -> int:
+    return _request_scope.get() or threading.get_ident()
+
+
+db_session = scoped_session(SessionLocal, scopefunc=_scope_key)
+
+
+def bind_request_scope(key: int):
+    """Bind the session registry to a request. Returns a token for reset_request_scope."""
+    return _request_scope.set(key)
+
+
+def reset_request_scope(token) -> None:
+    _request_scope.reset(token)
+
+
+class RequestScopeMiddleware:
+    """
+    Pure ASGI middleware binding the session registry to each HTTP request.
+    Sets the scope on the request's own task, so it adds no extra task or
+    body streaming the way a BaseHTTPMiddleware would.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = bind_request_scope(id(scope))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            reset_request_scope(token)
+
 
 def get_db():
-    """Dependency that yields a database session and closes it after use."""
-    db = SessionLocal()
+    """Dependency that yields the request's scoped session and removes it after use."""
     try:
-        yield db
+        yield db_session()
     finally:
-        db.close()
+        db_session.remove()
@@ -8,14 +8,22 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from sqlalchemy import func, inspect, select
 
-from app.database import engine, Base, SessionLocal
+from app.config import get_settings
+from app.database import engine, Base, SessionLocal, RequestScopeMiddleware
 from app.models.user import User
 from app.models.profile import UserProfile
 from app.models.area import Area
 from app.models.infrastructure import InfrastructureData
 from app.routers import auth, profile, areas, infrastructure, scoring, market
-from app.seed import seed_areas
+from app.seed import seed_areas, SEED_AREAS
+from app.services.http_client import get_client, close_client
+from app.utils.cache import request_key_builder
+from app.utils.responses import install_msgspec_schemas
 
 # ─── Logging setup ───
 logging.basicConfig(
@@ -23,24 +31,43 @@ logging.basicConfig(
     format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
 )
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Startup: create tables and seed data. Shutdown: cleanup."""
-    logger.info("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+def init_database() -> None:
+    """
+    Create missing tables and seed areas, skipping work that is already done.
+    Only issues DDL when a mapped table is missing, and only opens a seed
+    transaction when fewer areas exist than are predefined.
+    """
+    existing_tables = set(inspect(engine).get_table_names())
+    if not set(Base.metadata.tables).issubset(existing_tables):
+        logger.info("Creating database tables...")
+        Base.metadata.create_all(bind=engine)
 
-    logger.info("Seeding predefined areas...")
     db = SessionLocal()
     try:
-        seed_areas(db)
+        area_count = db.execute(select(func.count(Area.id))).scalar_one()
+        if area_count < len(SEED_AREAS):
+            logger.info("Seeding predefined areas...")
+            seed_areas(db)
     finally:
         db.close()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup: create tables, seed data and init the response cache. Shutdown: cleanup."""
+    if settings.RUN_MIGRATIONS_ON_STARTUP:
+        init_database()
+
+    FastAPICache.init(InMemoryBackend(), prefix="avenir-cache", key_builder=request_key_builder)
+    get_client()  # warm the shared Overpass/Gemini HTTP client
+
     logger.info("Application startup complete.")
     yield
     logger.info("Application shutting down.")
+    await close_client()
 
 
 # ─── FastAPI app ───
@@ -49,6 +76,7 @@ app = FastAPI(
     description="AI-powered lifestyle scoring engine for Hyderabad neighborhoods",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # ─── CORS middleware (allow frontend at localhost:5173 / 8080) ───
@@ -60,6 +88,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ─── Scope the DB session registry to each request ───
+app.add_middleware(RequestScopeMiddleware)
+
+
 # ─── Include routers ───
 app.include_router(auth.router)
 app.include_router(profile.router)
@@ -67,6 +99,7 @@ app.include_router(areas.router)
 app.include_router(infrastructure.router)
 app.include_router(scoring.router)
 app.include_router(market.router)
+install_msgspec_schemas(app)
 
 
 @app.get("/", tags=["Health"])
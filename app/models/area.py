@@ -4,8 +4,8 @@ Area model – predefined Hyderabad neighborhoods.
 
 from sqlalchemy import Column, Integer, String, Float, Text, DateTime
 from sqlalchemy.orm import relationship
-from datetime import datetime, timezone
 from app.database import Base
+from app.utils.clock import utc_now
 
 
 class Area(Base):
@@ -18,6 +18,6 @@ class Area(Base):
     boundary_type = Column(String(20), default="circle")  # circle / polygon
     radius_meters = Column(Integer, nullable=True, default=2000)
     polygon_geojson = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=utc_now)
 
     infrastructure = relationship("InfrastructureData", back_populates="area", uselist=False)
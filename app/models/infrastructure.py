@@ -2,10 +2,10 @@
 InfrastructureData model – cached facility counts from Overpass API.
 """
 
-from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey
 from sqlalchemy.orm import relationship
-from datetime import datetime, timezone
 from app.database import Base
+from app.utils.clock import UTCDateTime, utc_now
 
 
 class InfrastructureData(Base):
@@ -21,6 +21,6 @@ class InfrastructureData(Base):
     restaurant_count = Column(Integer, default=0)
     gym_count = Column(Integer, default=0)
     bar_count = Column(Integer, default=0)
-    last_updated = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    last_updated = Column(UTCDateTime, default=utc_now)
 
     area = relationship("Area", back_populates="infrastructure")
@@ -4,15 +4,15 @@ UserProfile model – stores lifestyle preferences for scoring.
 
 from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text
 from sqlalchemy.orm import relationship
-from datetime import datetime, timezone
 from app.database import Base
+from app.utils.clock import utc_now
 
 
 class UserProfile(Base):
     __tablename__ = "user_profiles"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), unique=True, index=True, nullable=False)
     marital_status = Column(String(20), nullable=False, default="single")  # single / married
     has_parents = Column(Boolean, default=False)
     employment_status = Column(String(20), nullable=False, default="working")  # student / working / unemployed
@@ -22,6 +22,6 @@ class UserProfile(Base):
     has_elderly = Column(Boolean, default=False)  # lives with elderly people
     has_children = Column(Boolean, default=False)  # has children
     profile_picture = Column(Text, nullable=True)  # base64 or URL of profile pic
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=utc_now)
 
     user = relationship("User", back_populates="profile")
@@ -4,8 +4,8 @@ User model – stores authentication data.
 
 from sqlalchemy import Column, Integer, String, Boolean, DateTime
 from sqlalchemy.orm import relationship
-from datetime import datetime, timezone
 from app.database import Base
+from app.utils.clock import utc_now
 
 
 class User(Base):
@@ -16,9 +16,9 @@ class User(Base):
     email = Column(String(255), unique=True, index=True, nullable=False)
     password_hash = Column(String(255), nullable=False)
     is_profile_completed = Column(Boolean, default=False)
-    reset_token = Column(String(255), nullable=True)
+    reset_token = Column(String(255), unique=True, index=True, nullable=True)
     reset_token_expires = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=utc_now)
 
     # Relationship to profile
     profile = relationship("UserProfile", back_populates="user", uselist=False)
@@ -0,0 +1,35 @@
+"""
+One-shot pre-start script – creates tables and seeds areas before the
+workers boot. Run: python -m app.prestart [--warm-infrastructure]
+
+--warm-infrastructure also fetches infrastructure counts for every area
+in a single batched Overpass request, so the first score requests hit
+the DB cache.
+"""
+
+import asyncio
+import sys
+
+from sqlalchemy import select
+
+from app.database import SessionLocal
+from app.main import init_database
+from app.models.area import Area
+from app.services.http_client import close_client
+from app.services.overpass_service import get_infrastructure_for_areas
+
+
+async def warm_infrastructure() -> None:
+    db = SessionLocal()
+    try:
+        areas = db.execute(select(Area)).scalars().all()
+        await get_infrastructure_for_areas(areas, db)
+    finally:
+        db.close()
+        await close_client()
+
+
+if __name__ == "__main__":
+    init_database()
+    if "--warm-infrastructure" in sys.argv[1:]:
+        asyncio.run(warm_infrastructure())
@@ -4,27 +4,49 @@ Areas router – list and retrieve Hyderabad areas.
 
 import logging
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from fastapi_cache.decorator import cache
+from sqlalchemy import select
+from sqlalchemy.orm import Session, load_only
 
 from app.database import get_db
 from app.models.area import Area
 from app.schemas.area import AreaResponse, AreaListResponse
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/areas", tags=["Areas"])
+router = APIRouter(prefix="/areas", tags=["Areas"], default_response_class=ORJSONResponse)
+
+# Areas are seeded at startup and effectively immutable
+AREA_CACHE_SECONDS = 3600
 
 
 @router.get("", response_model=AreaListResponse)
+@cache(expire=AREA_CACHE_SECONDS)
 def list_areas(db: Session = Depends(get_db)):
     """Return all predefined Hyderabad areas."""
-    areas = db.query(Area).all()
-    return AreaListResponse(areas=[AreaResponse.model_validate(a) for a in areas])
+    # Only SELECT the columns AreaResponse serializes. If infrastructure fields
+    # are ever added to the response, switch to selectinload(Area.infrastructure)
+    # to avoid a lazy load per row.
+    areas = db.execute(
+        select(Area).options(
+            load_only(
+                Area.id,
+                Area.name,
+                Area.center_lat,
+                Area.center_lon,
+                Area.boundary_type,
+                Area.radius_meters,
+            )
+        )
+    ).scalars().all()
+    return AreaListResponse.model_construct(areas=[AreaResponse.from_orm_row(a) for a in areas])
 
 
 @router.get("/{area_id}", response_model=AreaResponse)
+@cache(expire=AREA_CACHE_SECONDS)
 def get_area(area_id: int, db: Session = Depends(get_db)):
     """Get a single area by ID."""
-    area = db.query(Area).filter(Area.id == area_id).first()
+    area = db.get(Area, area_id)
     if not area:
         raise HTTPException(status_code=404, detail="Area not found")
-    return AreaResponse.model_validate(area)
+    return AreaResponse.from_orm_row(area)
@@ -7,7 +7,10 @@ import logging
 from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.database import get_db
 from app.models.user import User
@@ -20,22 +23,34 @@ from app.schemas.auth import (
     UserResponse,
     MessageResponse,
 )
-from app.utils.security import hash_password, verify_password, create_access_token
+from app.utils.security import hash_password, verify_and_update_password, create_access_token
 
 logger = logging.getLogger(__name__)
-router = APIRouter(tags=["Authentication"])
+router = APIRouter(tags=["Authentication"], default_response_class=ORJSONResponse)
+
+
+# The async handlers below run their password KDF in the threadpool; their
+# blocking session work goes through these helpers the same way, so none of
+# it runs on the event loop.
+def _user_by(db: Session, *criteria) -> User | None:
+    return db.execute(select(User).where(*criteria)).scalar_one_or_none()
+
+
+def _commit_and_refresh(db: Session, user: User) -> None:
+    db.commit()
+    db.refresh(user)
 
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
-def register(req: RegisterRequest, db: Session = Depends(get_db)):
+async def register(req: RegisterRequest, db: Session = Depends(get_db)):
     """
     Register a new user.
     - Validates email uniqueness
-    - Hashes password with bcrypt
+    - Hashes password with argon2
     - Returns JWT token immediately (auto-login after registration)
     """
     # Check if email already exists
-    existing = db.query(User).filter(User.email == req.email).first()
+    existing = await run_in_threadpool(_user_by, db, User.email == req.email)
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
 
@@ -43,39 +58,49 @@ def register(req: RegisterRequest, db: Session = Depends(get_db)):
     user = User(
         name=req.name,
         email=req.email,
-        password_hash=hash_password(req.password),
+        password_hash=await run_in_threadpool(hash_password, req.password),
         is_profile_completed=False,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await run_in_threadpool(_commit_and_refresh, db, user)
 
     # Generate JWT
     token = create_access_token(data={"sub": str(user.id)})
     logger.info(f"User registered: {user.email}")
 
-    return TokenResponse(
+    return TokenResponse.model_construct(
         access_token=token,
-        user=UserResponse.model_validate(user),
+        user=UserResponse.from_orm_row(user),
     )
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(req: LoginRequest, db: Session = Depends(get_db)):
+async def login(req: LoginRequest, db: Session = Depends(get_db)):
     """
     Authenticate user and return JWT.
     Response includes is_profile_completed so frontend can prompt profile setup.
     """
-    user = db.query(User).filter(User.email == req.email).first()
-    if not user or not verify_password(req.password, user.password_hash):
+    user = await run_in_threadpool(_user_by, db, User.email == req.email)
+    if not user:
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
+    valid, new_hash = await run_in_threadpool(
+        verify_and_update_password, req.password, user.password_hash
+    )
+    if not valid:
+        raise HTTPException(status_code=401, detail="Invalid email or password")
+
+    # Transparently upgrade legacy bcrypt hashes to argon2
+    if new_hash:
+        user.password_hash = new_hash
+        await run_in_threadpool(_commit_and_refresh, db, user)
+
     token = create_access_token(data={"sub": str(user.id)})
     logger.info(f"User logged in: {user.email}")
 
-    return TokenResponse(
+    return TokenResponse.model_construct(
         access_token=token,
-        user=UserResponse.model_validate(user),
+        user=UserResponse.from_orm_row(user),
     )
 
 
@@ -86,7 +111,7 @@ def forgot_password(req: ForgotPasswordRequest, db: Session = Depends(get_db)):
     In production, this would send an email. For now, the token is stored
     and returned in the response (stubbed email).
     """
-    user = db.query(User).filter(User.email == req.email).first()
+    user = db.execute(select(User).where(User.email == req.email)).scalar_one_or_none()
     if not user:
         # Don't reveal whether user exists
         return MessageResponse(message="If an account with that email exists, a reset link has been sent.")
@@ -104,11 +129,11 @@ def forgot_password(req: ForgotPasswordRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/reset-password", response_model=MessageResponse)
-def reset_password(req: ResetPasswordRequest, db: Session = Depends(get_db)):
+async def reset_password(req: ResetPasswordRequest, db: Session = Depends(get_db)):
     """
     Reset password using a valid reset token.
     """
-    user = db.query(User).filter(User.reset_token == req.token).first()
+    user = await run_in_threadpool(_user_by, db, User.reset_token == req.token)
     if not user:
         raise HTTPException(status_code=400, detail="Invalid or expired reset token")
 
@@ -117,10 +142,10 @@ def reset_password(req: ResetPasswordRequest, db: Session = Depends(get_db)):
         raise HTTPException(status_code=400, detail="Reset token has expired")
 
     # Update password
-    user.password_hash = hash_password(req.new_password)
+    user.password_hash = await run_in_threadpool(hash_password, req.new_password)
     user.reset_token = None
     user.reset_token_expires = None
-    db.commit()
+    await run_in_threadpool(_commit_and_refresh, db, user)
 
     logger.info(f"Password reset successful for {user.email}")
     return MessageResponse(message="Password reset successful. You can now login.")
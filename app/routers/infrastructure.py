@@ -2,36 +2,43 @@
 Infrastructure router – fetch infrastructure data for an area.
 """
 
+import asyncio
 import logging
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.area import Area
 from app.schemas.infrastructure import InfrastructureResponse
-from app.services.overpass_service import get_infrastructure_for_area
+from app.services.overpass_service import AREA_WITH_INFRASTRUCTURE, get_infrastructure_for_area
 from app.schemas.infrastructure import InfrastructureWithLocationsResponse
 from app.services.overpass_service import fetch_facility_locations
+from app.utils.responses import MsgspecJSONResponse, msgspec_openapi_response
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/areas", tags=["Infrastructure"])
+router = APIRouter(prefix="/areas", tags=["Infrastructure"], default_response_class=ORJSONResponse)
 
 # List of 5 main area IDs (update as needed)
-MAIN_AREA_IDS = [1, 2, 3, 4, 5 ,6]
+MAIN_AREA_IDS = frozenset({1, 2, 3, 4, 5, 6})
 
-@router.get("/{area_id}/infrastructure", response_model=InfrastructureResponse)
+@router.get(
+    "/{area_id}/infrastructure",
+    response_class=MsgspecJSONResponse,
+    responses=msgspec_openapi_response(InfrastructureResponse),
+)
 async def get_area_infrastructure(area_id: int, db: Session = Depends(get_db)):
     """
     Get infrastructure data for a specific area.
     Uses caching – fetches from Overpass API if cache is stale or missing.
     """
-    area = db.query(Area).filter(Area.id == area_id).first()
+    area = db.get(Area, area_id, options=AREA_WITH_INFRASTRUCTURE)
     if not area:
         raise HTTPException(status_code=404, detail="Area not found")
 
     infra = await get_infrastructure_for_area(area, db)
 
-    return InfrastructureResponse(
+    return MsgspecJSONResponse(InfrastructureResponse(
         area_id=area.id,
         area_name=area.name,
         hospital_count=infra.hospital_count,
@@ -43,9 +50,13 @@ async def get_area_infrastructure(area_id: int, db: Session = Depends(get_db)):
         gym_count=infra.gym_count,
         bar_count=infra.bar_count,
         last_updated=infra.last_updated,
-    )
+    ))
 
-@router.get("/{area_id}/infrastructure/locations", response_model=InfrastructureWithLocationsResponse)
+@router.get(
+    "/{area_id}/infrastructure/locations",
+    response_class=MsgspecJSONResponse,
+    responses=msgspec_openapi_response(InfrastructureWithLocationsResponse),
+)
 async def get_area_infrastructure_locations(area_id: int, db: Session = Depends(get_db)):
     """
     Get infrastructure facility locations for a specific area (only for main areas).
@@ -53,13 +64,28 @@ async def get_area_infrastructure_locations(area_id: int, db: Session = Depends(
     """
     if area_id not in MAIN_AREA_IDS:
         raise HTTPException(status_code=403, detail="Facility locations only available for main areas.")
-    area = db.query(Area).filter(Area.id == area_id).first()
+    area = db.get(Area, area_id, options=AREA_WITH_INFRASTRUCTURE)
     if not area:
         raise HTTPException(status_code=404, detail="Area not found")
     force_refresh = (area_id == 6)
-    cats = await fetch_facility_locations(area.center_lat, area.center_lon, area.radius_meters or 2000)
-    infra = await get_infrastructure_for_area(area, db, force_refresh=force_refresh)
-    return InfrastructureWithLocationsResponse(
+    # Both are Overpass-bound; run them concurrently. Only the infra lookup
+    # touches the session, so sharing it across the gather is safe.
+    tasks = (
+        asyncio.create_task(
+            fetch_facility_locations(area.center_lat, area.center_lon, area.radius_meters or 2000)
+        ),
+        asyncio.create_task(get_infrastructure_for_area(area, db, force_refresh=force_refresh)),
+    )
+    try:
+        cats, infra = await asyncio.gather(*tasks)
+    except BaseException:
+        # gather doesn't cancel the sibling; stop it before the session is
+        # closed so it can't keep committing after the request has failed.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return MsgspecJSONResponse(InfrastructureWithLocationsResponse(
         area_id=area.id,
         area_name=area.name,
         hospital_count=infra.hospital_count,
@@ -79,4 +105,4 @@ async def get_area_infrastructure_locations(area_id: int, db: Session = Depends(
         restaurants=cats["restaurants"],
         gyms=cats["gyms"],
         bars=cats["bars"],
-    )
+    ))
@@ -2,21 +2,139 @@
 Market data router – serves housing / rental data from data.json.
 """
 
-import json
 import os
+import mmap
 import logging
+from functools import lru_cache
+
+import numpy as np
+import orjson
 from fastapi import APIRouter, Query
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/market", tags=["Market"])
+router = APIRouter(prefix="/market", tags=["Market"], default_response_class=ORJSONResponse)
 
 DATA_FILE = os.path.join(os.path.dirname(__file__), "..", "data.json")
 
 
+@lru_cache(maxsize=1)
+def _parse_data(mtime: float) -> dict:
+    """Parse data.json once per file version (mtime is the cache key)."""
+    # mmap the file and hand orjson a view of it, avoiding a userspace read copy
+    with open(DATA_FILE, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            data = orjson.loads(view)
+            size_kb = len(mm) / 1024
+    logger.info(f"Loaded market data ({len(data.get('listings', []))} listings, {size_kb:.1f} KB)")
+    return data
+
+
 def _load_data() -> dict:
-    with open(DATA_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Return the parsed market data, re-reading only if data.json changed on disk."""
+    return _parse_data(os.path.getmtime(DATA_FILE))
+
+
+def _empty_aggregate() -> dict:
+    return {
+        "count": 0,
+        "sum_rent": 0,
+        "sum_sqft": 0,
+        "sum_rate": 0,
+        "min_rent": None,
+        "max_rent": None,
+        "furnished": 0,
+    }
+
+
+@lru_cache(maxsize=1)
+def _build_index(mtime: float) -> dict:
+    """
+    Load listings into column arrays (rent, sqft, rent_per_sqft, area index,
+    furnished mask) and compute every per-area aggregate with grouped NumPy
+    reductions, plus an all-areas aggregate. Summary/compare become dict lookups.
+    """
+    listings = _parse_data(mtime).get("listings", [])
+    by_area: dict[str, list[dict]] = {}
+    for l in listings:
+        by_area.setdefault(l["area"].lower(), []).append(l)
+
+    if not listings:
+        return {"by_area": by_area, "summaries": {}, "all": _empty_aggregate()}
+
+    area_keys = list(by_area)
+    area_lookup = {key: i for i, key in enumerate(area_keys)}
+    n_areas = len(area_keys)
+
+    rent = np.asarray([l["rent"] for l in listings])
+    sqft = np.asarray([l["sqft"] for l in listings], dtype=np.float64)
+    rate = np.asarray([l["rent_per_sqft"] for l in listings], dtype=np.float64)
+    area_idx = np.asarray([area_lookup[l["area"].lower()] for l in listings], dtype=np.int32)
+    furnished_mask = np.asarray(
+        [l.get("furnishing", "").lower() == "furnished" for l in listings], dtype=bool
+    )
+
+    # Grouped sums / counts in one pass each
+    counts = np.bincount(area_idx, minlength=n_areas)
+    sum_rent = np.bincount(area_idx, weights=rent, minlength=n_areas)
+    sum_sqft = np.bincount(area_idx, weights=sqft, minlength=n_areas)
+    sum_rate = np.bincount(area_idx, weights=rate, minlength=n_areas)
+    furnished = np.bincount(area_idx, weights=furnished_mask, minlength=n_areas)
+
+    # Grouped min/max: sort rents by area, then reduce over contiguous segments
+    order = np.argsort(area_idx, kind="stable")
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    min_rent = np.minimum.reduceat(rent[order], starts)
+    max_rent = np.maximum.reduceat(rent[order], starts)
+
+    summaries = {
+        key: {
+            "count": int(counts[i]),
+            "sum_rent": sum_rent[i].item(),
+            "sum_sqft": sum_sqft[i].item(),
+            "sum_rate": sum_rate[i].item(),
+            "min_rent": min_rent[i].item(),
+            "max_rent": max_rent[i].item(),
+            "furnished": int(furnished[i]),
+        }
+        for key, i in area_lookup.items()
+    }
+    all_areas = {
+        "count": len(listings),
+        "sum_rent": rent.sum().item(),
+        "sum_sqft": sqft.sum().item(),
+        "sum_rate": rate.sum().item(),
+        "min_rent": rent.min().item(),
+        "max_rent": rent.max().item(),
+        "furnished": int(np.count_nonzero(furnished_mask)),
+    }
+    return {"by_area": by_area, "summaries": summaries, "all": all_areas}
+
+
+def _index() -> dict:
+    return _build_index(os.path.getmtime(DATA_FILE))
+
+
+def _by_area() -> dict[str, list[dict]]:
+    return _index()["by_area"]
+
+
+def _summary_by_area() -> dict[str, dict]:
+    return _index()["summaries"]
+
+
+def _summary_stats(agg: dict) -> dict:
+    """Turn a precomputed aggregate into the averaged stats returned by the API."""
+    count = agg["count"]
+    return {
+        "count": count,
+        "avg_rent": round(agg["sum_rent"] / count),
+        "avg_sqft": round(agg["sum_sqft"] / count),
+        "avg_rent_per_sqft": round(agg["sum_rate"] / count, 1),
+        "min_rent": agg["min_rent"],
+        "max_rent": agg["max_rent"],
+    }
 
 
 @router.get("/listings")
@@ -28,7 +146,7 @@ def get_listings(area: Optional[str] = Query(None, description="Filter by area n
     listings = data.get("listings", [])
 
     if area:
-        listings = [l for l in listings if l["area"].lower() == area.lower()]
+        listings = _by_area().get(area.lower(), [])
 
     return {
         "city": data.get("city", "Hyderabad"),
@@ -54,32 +172,16 @@ def get_market_summary(area: Optional[str] = Query(None)):
     Return aggregated summary stats for an area (or all areas).
     Includes avg rent, avg sqft, avg rent_per_sqft, listing count.
     """
-    data = _load_data()
-    listings = data.get("listings", [])
+    agg = _summary_by_area().get(area.lower()) if area else _index()["all"]
 
-    if area:
-        listings = [l for l in listings if l["area"].lower() == area.lower()]
-
-    if not listings:
+    if not agg or not agg["count"]:
         return {"area": area, "count": 0}
 
-    avg_rent = sum(l["rent"] for l in listings) / len(listings)
-    avg_sqft = sum(l["sqft"] for l in listings) / len(listings)
-    avg_rate = sum(l["rent_per_sqft"] for l in listings) / len(listings)
-    min_rent = min(l["rent"] for l in listings)
-    max_rent = max(l["rent"] for l in listings)
-    furnished = sum(1 for l in listings if l.get("furnishing", "").lower() == "furnished")
-
     return {
         "area": area or "All Areas",
-        "count": len(listings),
-        "avg_rent": round(avg_rent),
-        "avg_sqft": round(avg_sqft),
-        "avg_rent_per_sqft": round(avg_rate, 1),
-        "min_rent": min_rent,
-        "max_rent": max_rent,
-        "furnished_count": furnished,
-        "unfurnished_count": len(listings) - furnished,
+        **_summary_stats(agg),
+        "furnished_count": agg["furnished"],
+        "unfurnished_count": agg["count"] - agg["furnished"],
     }
 
 
@@ -91,25 +193,18 @@ def compare_areas(
     """
     Compare two areas side by side with summary stats.
     """
-    data = _load_data()
-    listings = data.get("listings", [])
+    summaries = _summary_by_area()
+    by_area = _by_area()
 
     def summarize(area_name: str):
-        area_listings = [l for l in listings if l["area"].lower() == area_name.lower()]
-        if not area_listings:
+        key = area_name.lower()
+        agg = summaries.get(key)
+        if not agg:
             return {"area": area_name, "count": 0}
-        avg_rent = sum(l["rent"] for l in area_listings) / len(area_listings)
-        avg_sqft = sum(l["sqft"] for l in area_listings) / len(area_listings)
-        avg_rate = sum(l["rent_per_sqft"] for l in area_listings) / len(area_listings)
         return {
             "area": area_name,
-            "count": len(area_listings),
-            "avg_rent": round(avg_rent),
-            "avg_sqft": round(avg_sqft),
-            "avg_rent_per_sqft": round(avg_rate, 1),
-            "min_rent": min(l["rent"] for l in area_listings),
-            "max_rent": max(l["rent"] for l in area_listings),
-            "listings": area_listings,
+            **_summary_stats(agg),
+            "listings": by_area[key],
         }
 
     return {
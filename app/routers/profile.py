@@ -3,28 +3,40 @@ Profile router – CRUD operations for user lifestyle profile + password change.
 """
 
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session, defer
+from starlette.concurrency import run_in_threadpool
 
 from app.database import get_db
 from app.models.user import User
 from app.models.profile import UserProfile
 from app.schemas.profile import ProfileCreate, ProfileUpdate, ProfileResponse, PasswordChangeRequest
-from app.utils.security import get_current_user, verify_password, hash_password
+from app.utils.security import get_current_user, invalidate_cached_user, verify_password, hash_password
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/profile", tags=["Profile"])
+router = APIRouter(prefix="/profile", tags=["Profile"], default_response_class=ORJSONResponse)
 
 
 @router.get("", response_model=ProfileResponse | None)
 def get_profile(
+    include_picture: bool = Query(True, description="Set false to skip the (large) profile picture"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get the current user's lifestyle profile. Returns null if not created."""
-    profile = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
+    stmt = select(UserProfile).where(UserProfile.user_id == current_user.id)
+    if not include_picture:
+        stmt = stmt.options(defer(UserProfile.profile_picture))
+    profile = db.execute(stmt).scalar_one_or_none()
     if not profile:
         return None
+    if not include_picture:
+        # Build the response without touching the deferred column (would lazy-load it)
+        return ProfileResponse.model_validate(
+            {f: getattr(profile, f) for f in ProfileResponse.model_fields if f != "profile_picture"}
+        )
     return profile
 
 
@@ -38,7 +50,7 @@ def create_profile(
     Create lifestyle profile for the first time.
     Marks is_profile_completed = True on the user.
     """
-    existing = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
+    existing = db.execute(select(UserProfile.id).where(UserProfile.user_id == current_user.id)).scalar_one_or_none()
     if existing:
         raise HTTPException(status_code=400, detail="Profile already exists. Use PUT to update.")
 
@@ -59,6 +71,7 @@ def create_profile(
     # Mark profile as completed
     current_user.is_profile_completed = True
     db.commit()
+    invalidate_cached_user(current_user.id)
     db.refresh(profile)
 
     logger.info(f"Profile created for user {current_user.id}")
@@ -72,7 +85,7 @@ def update_profile(
     db: Session = Depends(get_db),
 ):
     """Update existing lifestyle profile."""
-    profile = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
+    profile = db.execute(select(UserProfile).where(UserProfile.user_id == current_user.id)).scalar_one_or_none()
     if not profile:
         raise HTTPException(status_code=404, detail="Profile not found. Create one first.")
 
@@ -93,17 +106,25 @@ def update_profile(
     return profile
 
 
+def _password_matches(user: User, password: str) -> bool:
+    """Check `password` against the user's hash; loads the deferred column too."""
+    return verify_password(password, user.password_hash)
+
+
 @router.post("/change-password")
-def change_password(
+async def change_password(
     req: PasswordChangeRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Change the current user's password."""
-    if not verify_password(req.current_password, current_user.password_hash):
+    # Session work (the deferred hash load, the commit) runs in the threadpool
+    # alongside the KDF rather than on the event loop.
+    user_id = current_user.id
+    if not await run_in_threadpool(_password_matches, current_user, req.current_password):
         raise HTTPException(status_code=400, detail="Current password is incorrect")
 
-    current_user.password_hash = hash_password(req.new_password)
-    db.commit()
-    logger.info(f"Password changed for user {current_user.id}")
+    current_user.password_hash = await run_in_threadpool(hash_password, req.new_password)
+    await run_in_threadpool(db.commit)
+    logger.info(f"Password changed for user {user_id}")
     return {"message": "Password changed successfully"}
@@ -4,7 +4,9 @@ Scoring router – compute and return lifestyle scores for areas.
 
 import logging
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session, defer
 
 from app.database import get_db
 from app.models.area import Area
@@ -12,16 +14,21 @@ from app.models.user import User
 from app.models.profile import UserProfile
 from app.models.infrastructure import InfrastructureData
 from app.schemas.scoring import ScoreResponse
-from app.services.overpass_service import get_infrastructure_for_area, fetch_from_overpass
+from app.services.overpass_service import AREA_WITH_INFRASTRUCTURE, get_infrastructure_for_area, fetch_from_overpass
 from app.services.scoring_engine import compute_final_score
 from app.services.gemini_service import get_gemini_recommendation
+from app.utils.responses import MsgspecJSONResponse, msgspec_openapi_response
 from app.utils.security import get_optional_user
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/areas", tags=["Scoring"])
+router = APIRouter(prefix="/areas", tags=["Scoring"], default_response_class=ORJSONResponse)
 
 
-@router.get("/score/custom", response_model=ScoreResponse)
+@router.get(
+    "/score/custom",
+    response_class=MsgspecJSONResponse,
+    responses=msgspec_openapi_response(ScoreResponse),
+)
 async def get_custom_score(
     lat: float = Query(..., description="Latitude"),
     lon: float = Query(..., description="Longitude"),
@@ -53,19 +60,23 @@ async def get_custom_score(
 
     profile = None
     if current_user:
-        profile = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
+        profile = db.execute(
+            select(UserProfile)
+            .options(defer(UserProfile.profile_picture))
+            .where(UserProfile.user_id == current_user.id)
+        ).scalar_one_or_none()
 
     result = compute_final_score(infra, profile)
 
-    return ScoreResponse(
+    return MsgspecJSONResponse(ScoreResponse(
         area_id=0,
         area_name=f"Custom ({lat:.4f}, {lon:.4f})",
-        final_score=result["final_score"],
-        category_scores=result["category_scores"],
-        weights_used=result["weights_used"],
-        infrastructure=result["infrastructure"],
-        profile_context=result["profile_context"],
-    )
+        final_score=result.final_score,
+        category_scores=result.category_scores,
+        weights_used=result.weights_used,
+        infrastructure=result.infrastructure,
+        profile_context=result.profile_context,
+    ))
 
 
 @router.post("/score/recommend")
@@ -88,7 +99,11 @@ async def get_ai_recommendation(
     return {"recommendation": recommendation}
 
 
-@router.get("/{area_id}/score", response_model=ScoreResponse)
+@router.get(
+    "/{area_id}/score",
+    response_class=MsgspecJSONResponse,
+    responses=msgspec_openapi_response(ScoreResponse),
+)
 async def get_area_score(
     area_id: int,
     db: Session = Depends(get_db),
@@ -97,7 +112,7 @@ async def get_area_score(
     """
     Compute the lifestyle score for a predefined area.
     """
-    area = db.query(Area).filter(Area.id == area_id).first()
+    area = db.get(Area, area_id, options=AREA_WITH_INFRASTRUCTURE)
     if not area:
         raise HTTPException(status_code=404, detail="Area not found")
 
@@ -105,16 +120,20 @@ async def get_area_score(
 
     profile = None
     if current_user:
-        profile = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
+        profile = db.execute(
+            select(UserProfile)
+            .options(defer(UserProfile.profile_picture))
+            .where(UserProfile.user_id == current_user.id)
+        ).scalar_one_or_none()
 
     result = compute_final_score(infra, profile)
 
-    return ScoreResponse(
+    return MsgspecJSONResponse(ScoreResponse(
         area_id=area.id,
         area_name=area.name,
-        final_score=result["final_score"],
-        category_scores=result["category_scores"],
-        weights_used=result["weights_used"],
-        infrastructure=result["infrastructure"],
-        profile_context=result["profile_context"],
-    )
+        final_score=result.final_score,
+        category_scores=result.category_scores,
+        weights_used=result.weights_used,
+        infrastructure=result.infrastructure,
+        profile_context=result.profile_context,
+    ))
@@ -17,6 +17,21 @@ class AreaResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @classmethod
+    def from_orm_row(cls, area) -> "AreaResponse":
+        """
+        Build from a trusted Area row without running validation.
+        Only for DB-origin objects – never for user input.
+        """
+        return cls.model_construct(
+            id=area.id,
+            name=area.name,
+            center_lat=area.center_lat,
+            center_lon=area.center_lon,
+            boundary_type=area.boundary_type,
+            radius_meters=area.radius_meters,
+        )
+
 
 class AreaListResponse(BaseModel):
     areas: list[AreaResponse]
@@ -39,6 +39,19 @@ class UserResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @classmethod
+    def from_orm_row(cls, user) -> "UserResponse":
+        """
+        Build from a trusted User row without running validation.
+        Only for DB-origin objects – never for user input.
+        """
+        return cls.model_construct(
+            id=user.id,
+            name=user.name,
+            email=user.email,
+            is_profile_completed=user.is_profile_completed,
+        )
+
 
 class MessageResponse(BaseModel):
     message: str
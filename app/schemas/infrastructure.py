@@ -1,13 +1,18 @@
 """
 Infrastructure response schemas.
+
+These are output-only and sit on the hottest serialization path (hundreds of
+facility locations per response), so they are msgspec Structs encoded
+directly to JSON bytes rather than Pydantic models.
 """
 
-from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional, List
 
+import msgspec
+
 
-class InfrastructureResponse(BaseModel):
+class InfrastructureResponse(msgspec.Struct, kw_only=True):
     area_id: int
     area_name: str
     hospital_count: int
@@ -20,15 +25,13 @@ class InfrastructureResponse(BaseModel):
     bar_count: int = 0
     last_updated: Optional[datetime] = None
 
-    model_config = {"from_attributes": True}
-
-class FacilityLocation(BaseModel):
+class FacilityLocation(msgspec.Struct, kw_only=True):
     name: str | None = None
     lat: float
     lon: float
     type: str
 
-class InfrastructureWithLocationsResponse(InfrastructureResponse):
+class InfrastructureWithLocationsResponse(InfrastructureResponse, kw_only=True):
     hospitals: List[FacilityLocation] = []
     schools: List[FacilityLocation] = []
     bus_stops: List[FacilityLocation] = []
@@ -1,11 +1,15 @@
 """
 Scoring response schemas.
+
+Score breakdowns are produced by the scoring engine, cached, and encoded
+straight to JSON, so they are frozen msgspec Structs rather than Pydantic
+models: a cached breakdown can be shared without copying.
 """
 
-from pydantic import BaseModel
+import msgspec
 
 
-class CategoryScores(BaseModel):
+class CategoryScores(msgspec.Struct, frozen=True):
     transport: float
     healthcare: float
     education: float
@@ -13,7 +17,7 @@ class CategoryScores(BaseModel):
     grocery: float
 
 
-class WeightsUsed(BaseModel):
+class WeightsUsed(msgspec.Struct, frozen=True):
     transport: float
     healthcare: float
     education: float
@@ -21,7 +25,7 @@ class WeightsUsed(BaseModel):
     grocery: float
 
 
-class ProfileContext(BaseModel):
+class ProfileContext(msgspec.Struct, frozen=True, kw_only=True):
     """Shows how user profile influenced the weights."""
     marital_status: str
     has_parents: bool
@@ -30,10 +34,10 @@ class ProfileContext(BaseModel):
     has_elderly: bool = False
     has_children: bool = False
     income_range: str | None = None
-    adjustments: list[str]  # Human-readable explanations
+    adjustments: tuple[str, ...]  # Human-readable explanations
 
 
-class InfrastructureCounts(BaseModel):
+class InfrastructureCounts(msgspec.Struct, frozen=True, kw_only=True):
     hospitals: int
     schools: int
     bus_stops: int
@@ -44,7 +48,16 @@ class InfrastructureCounts(BaseModel):
     bars: int = 0
 
 
-class ScoreResponse(BaseModel):
+class ScoreBreakdown(msgspec.Struct, frozen=True, kw_only=True):
+    """Result of compute_final_score for one area."""
+    final_score: float
+    category_scores: CategoryScores
+    weights_used: WeightsUsed
+    infrastructure: InfrastructureCounts
+    profile_context: ProfileContext | None = None
+
+
+class ScoreResponse(msgspec.Struct, frozen=True, kw_only=True):
     area_id: int
     area_name: str
     final_score: float
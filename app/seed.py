@@ -4,11 +4,16 @@ Run this after the database tables are created.
 """
 
 import logging
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from app.models.area import Area
 
 logger = logging.getLogger(__name__)
 
+# Dialects with INSERT ... ON CONFLICT DO NOTHING, keyed by dialect name
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
 # ─── Predefined Hyderabad areas with real coordinates ───
 SEED_AREAS = [
     {
@@ -59,17 +64,28 @@ SEED_AREAS = [
 def seed_areas(db: Session) -> None:
     """
     Insert predefined areas into the database if they don't already exist.
-    Uses upsert-like logic: skip if area name already exists.
+    On PostgreSQL and SQLite this is one INSERT ... ON CONFLICT (name) DO
+    NOTHING; other backends look up existing names in one SELECT, then
+    insert the missing areas in a single batched INSERT. Commits once.
     """
-    for area_data in SEED_AREAS:
-        existing = db.query(Area).filter(Area.name == area_data["name"]).first()
-        if existing:
-            logger.info(f"Area '{area_data['name']}' already exists, skipping.")
-            continue
+    dialect_insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if dialect_insert is not None:
+        stmt = dialect_insert(Area).values(SEED_AREAS).on_conflict_do_nothing(index_elements=["name"])
+        seeded = db.execute(stmt).rowcount
+        db.commit()
+        logger.info(f"Area seeding complete ({seeded} new, {len(SEED_AREAS) - seeded} already present).")
+        return
+
+    names = [a["name"] for a in SEED_AREAS]
+    existing = set(db.execute(select(Area.name).where(Area.name.in_(names))).scalars())
+    for name in existing:
+        logger.info(f"Area '{name}' already exists, skipping.")
 
-        area = Area(**area_data)
-        db.add(area)
-        logger.info(f"Seeded area: {area_data['name']}")
+    missing = [a for a in SEED_AREAS if a["name"] not in existing]
+    if missing:
+        db.execute(insert(Area), missing)
+        for area_data in missing:
+            logger.info(f"Seeded area: {area_data['name']}")
 
     db.commit()
     logger.info("Area seeding complete.")
@@ -4,9 +4,12 @@ user profile and scoring data. Falls back to a deterministic
 generic recommendation when the API is unavailable or over quota.
 """
 
+import hashlib
 import logging
-import httpx
+import orjson
 from app.config import get_settings
+from app.services.http_client import get_client
+from app.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -16,6 +19,67 @@ GEMINI_URL = (
     "gemini-2.0-flash:generateContent"
 )
 
+# Successful recommendations keyed by sha256(prompt); fallbacks are never cached
+RECOMMENDATION_CACHE_SECONDS = 24 * 3600
+_recommendation_cache = TTLCache(maxsize=2048, ttl_seconds=RECOMMENDATION_CACHE_SECONDS)
+
+
+# ── System instruction telling Gemini exactly what we need ──
+_SYSTEM_PROMPT = (
+    "You are Avenir, a concise lifestyle advisor for people considering "
+    "localities in Hyderabad, India. "
+    "Given locality score data and the user's personal profile, write "
+    "EXACTLY 2-3 short sentences recommending whether this locality suits "
+    "the person. Be specific about strengths and weaknesses based on the "
+    "numbers provided. Do NOT use bullet points, markdown, bold, italics, "
+    "headings, or asterisks. Keep the tone friendly and direct. "
+    "If the user profile is missing or incomplete, give a general "
+    "recommendation based on the scores alone."
+)
+
+# Static persona sent once per request as Gemini's system_instruction rather
+# than repeated inside the user prompt.
+_SYSTEM_INSTRUCTION = {"parts": [{"text": _SYSTEM_PROMPT}]}
+
+_PROMPT_TEMPLATE = """Locality: {locality_name}
+Overall Lifestyle Score: {final_score}/100
+Category Scores: {scores_section}
+Nearby Infrastructure: {infra_section}
+User Profile: {profile_section}
+
+Write your 2-3 sentence recommendation now (plain text only):"""
+
+# Display labels for the category / infrastructure keys produced by the scoring engine
+_LABELS = {
+    k: k.replace("_", " ").title()
+    for k in (
+        "transport", "healthcare", "education", "lifestyle", "grocery",
+        "hospitals", "schools", "bus_stops", "metro_stations",
+        "supermarkets", "restaurants", "gyms", "bars",
+    )
+}
+
+def _yes_no(value) -> str:
+    return "Yes" if value else "No"
+
+
+# Profile fields in render order, with how each value is shown.
+# Missing (None) and empty-string values are skipped.
+_PROFILE_FIELDS = (
+    ("marital_status", "Marital status", str),
+    ("employment_status", "Employment", str),
+    ("income_range", "Income range", str),
+    ("has_vehicle", "Has vehicle", _yes_no),
+    ("has_elderly", "Has elderly dependents", _yes_no),
+    ("has_children", "Has children", _yes_no),
+    ("has_parents", "Living with parents", _yes_no),
+)
+
+
+def _label(key: str) -> str:
+    label = _LABELS.get(key)
+    return label if label is not None else key.replace("_", " ").title()
+
 
 def _build_prompt(
     locality_name: str,
@@ -24,62 +88,29 @@ def _build_prompt(
     infrastructure: dict,
     profile: dict | None,
 ) -> str:
-    """Build a deterministic prompt so Gemini returns a consistent short paragraph."""
-
-    # ── System instruction telling Gemini exactly what we need ──
-    system = (
-        "You are Avenir, a concise lifestyle advisor for people considering "
-        "localities in Hyderabad, India. "
-        "Given locality score data and the user's personal profile, write "
-        "EXACTLY 2-3 short sentences recommending whether this locality suits "
-        "the person. Be specific about strengths and weaknesses based on the "
-        "numbers provided. Do NOT use bullet points, markdown, bold, italics, "
-        "headings, or asterisks. Keep the tone friendly and direct. "
-        "If the user profile is missing or incomplete, give a general "
-        "recommendation based on the scores alone."
-    )
+    """
+    Build the per-request part of the prompt (the persona goes in
+    _SYSTEM_INSTRUCTION) so Gemini returns a consistent short paragraph.
+    """
 
     # ── User profile section ──
-    if profile and any(v for v in profile.values() if v is not None):
-        profile_lines = []
-        if profile.get("marital_status"):
-            profile_lines.append(f"Marital status: {profile['marital_status']}")
-        if profile.get("employment_status"):
-            profile_lines.append(f"Employment: {profile['employment_status']}")
-        if profile.get("income_range"):
-            profile_lines.append(f"Income range: {profile['income_range']}")
-        if profile.get("has_vehicle") is not None:
-            profile_lines.append(f"Has vehicle: {'Yes' if profile['has_vehicle'] else 'No'}")
-        if profile.get("has_elderly") is not None:
-            profile_lines.append(f"Has elderly dependents: {'Yes' if profile['has_elderly'] else 'No'}")
-        if profile.get("has_children") is not None:
-            profile_lines.append(f"Has children: {'Yes' if profile['has_children'] else 'No'}")
-        if profile.get("has_parents") is not None:
-            profile_lines.append(f"Living with parents: {'Yes' if profile['has_parents'] else 'No'}")
-        profile_section = "; ".join(profile_lines) if profile_lines else "No profile data available."
-    else:
-        profile_section = "No profile data available."
-
-    # ── Infrastructure counts ──
-    infra_section = ", ".join(
-        f"{k.replace('_', ' ').title()}: {v}" for k, v in infrastructure.items()
-    )
-
-    # ── Category scores ──
-    scores_section = ", ".join(
-        f"{k.replace('_', ' ').title()}: {v}/100" for k, v in category_scores.items()
+    profile_lines = []
+    if profile:
+        for key, label, fmt in _PROFILE_FIELDS:
+            value = profile.get(key)
+            if value is None or value == "":
+                continue
+            profile_lines.append(f"{label}: {fmt(value)}")
+    profile_section = "; ".join(profile_lines) or "No profile data available."
+
+    return _PROMPT_TEMPLATE.format(
+        locality_name=locality_name,
+        final_score=final_score,
+        scores_section=", ".join(f"{_label(k)}: {v}/100" for k, v in category_scores.items()),
+        infra_section=", ".join(f"{_label(k)}: {v}" for k, v in infrastructure.items()),
+        profile_section=profile_section,
     )
 
-    return f"""{system}
-
-Locality: {locality_name}
-Overall Lifestyle Score: {final_score}/100
-Category Scores: {scores_section}
-Nearby Infrastructure: {infra_section}
-User Profile: {profile_section}
-
-Write your 2-3 sentence recommendation now (plain text only):"""
-
 
 def _generate_fallback(
     locality_name: str,
@@ -151,8 +182,13 @@ async def get_gemini_recommendation(
     prompt = _build_prompt(
         locality_name, final_score, category_scores, infrastructure, profile
     )
+    cache_key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    cached = _recommendation_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     payload = {
+        "system_instruction": _SYSTEM_INSTRUCTION,
         "contents": [{"parts": [{"text": prompt}]}],
         "generationConfig": {
             "temperature": 0.4,
@@ -162,21 +198,22 @@ async def get_gemini_recommendation(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.post(
-                f"{GEMINI_URL}?key={settings.GEMINI_API_KEY}",
-                json=payload,
-            )
+        client = get_client()
+        resp = await client.post(
+            f"{GEMINI_URL}?key={settings.GEMINI_API_KEY}",
+            json=payload,
+            timeout=30.0,
+        )
 
-            if resp.status_code == 429:
-                logger.warning("Gemini API quota exceeded (429). Using fallback.")
-                return _generate_fallback(
-                    locality_name, final_score, category_scores,
-                    infrastructure, profile,
-                )
+        if resp.status_code == 429:
+            logger.warning("Gemini API quota exceeded (429). Using fallback.")
+            return _generate_fallback(
+                locality_name, final_score, category_scores,
+                infrastructure, profile,
+            )
 
-            resp.raise_for_status()
-            data = resp.json()
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
 
         # Extract text from Gemini response
         text = (
@@ -186,7 +223,9 @@ async def get_gemini_recommendation(
             .get("text", "")
         )
         if text and text.strip():
-            return text.strip()
+            text = text.strip()
+            _recommendation_cache.set(cache_key, text)
+            return text
 
         logger.warning("Gemini returned empty text. Using fallback.")
         return _generate_fallback(
@@ -0,0 +1,30 @@
+"""
+Shared outbound HTTP client for Overpass and Gemini.
+A single pooled AsyncClient (HTTP/2, keep-alive) is created lazily and
+closed from the FastAPI lifespan, so calls reuse TCP/TLS connections.
+"""
+
+import httpx
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the process-wide AsyncClient, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=60.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            headers={"User-Agent": "Avenir/1.0"},
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client (called on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
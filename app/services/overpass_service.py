@@ -4,181 +4,237 @@ Fetches infrastructure data (hospitals, schools, bus stops, metro stations,
 supermarkets, restaurants) for a given area from OpenStreetMap.
 """
 
+import asyncio
 import logging
-import httpx
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
-from sqlalchemy.orm import Session
+
+import ijson
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, raiseload
 from app.models.area import Area
 from app.models.infrastructure import InfrastructureData
 from app.config import get_settings
+from app.services.http_client import get_client
+from app.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Freshness window for InfrastructureData rows
+_TTL = timedelta(hours=settings.CACHE_TTL_HOURS)
 
-def build_overpass_query(lat: float, lon: float, radius: int) -> str:
-    """
-    Build an Overpass QL query to fetch all infrastructure categories
-    within a circular area defined by lat, lon, and radius (meters).
-
-    Categories queried:
-    - Hospitals: amenity=hospital OR amenity=clinic
-    - Schools: amenity=school
-    - Bus stops: highway=bus_stop OR public_transport=platform + bus
-    - Metro stations: station=subway OR railway=station
-    - Supermarkets: shop=supermarket
-    - Restaurants: amenity=restaurant OR amenity=fast_food
-    """
-    around = f"around:{radius},{lat},{lon}"
-    query = f"""
-[out:json][timeout:30];
-(
+# Loader options for areas passed to get_infrastructure_for_area: the cached
+# row comes back in the same query, and any other lazy load raises instead
+# of silently issuing another SELECT.
+AREA_WITH_INFRASTRUCTURE = (joinedload(Area.infrastructure), raiseload("*"))
+
+
+# Count queries use CSV output: each `out count;` yields one line holding the
+# total, so the response is a few bytes instead of a JSON element document.
+COUNT_QUERY_HEADER = "[out:csv(::count;false)][timeout:{timeout}];"
+
+
+# One union block per count field, in the order the responses are parsed.
+# `{around}` is filled with the `around:radius,lat,lon` filter.
+CATEGORY_QUERIES: dict[str, str] = {
+    "hospital_count": """(
   // Hospitals & clinics
   node["amenity"="hospital"]({around});
   way["amenity"="hospital"]({around});
   node["amenity"="clinic"]({around});
   way["amenity"="clinic"]({around});
 );
-out count;
-
-(
+out count;""",
+    "school_count": """(
   // Schools
   node["amenity"="school"]({around});
   way["amenity"="school"]({around});
 );
-out count;
-
-(
+out count;""",
+    "bus_stop_count": """(
   // Bus stops
   node["highway"="bus_stop"]({around});
   node["public_transport"="platform"]["bus"="yes"]({around});
 );
-out count;
-
-(
+out count;""",
+    "metro_count": """(
   // Metro / railway stations
   node["station"="subway"]({around});
   node["railway"="station"]({around});
   way["railway"="station"]({around});
 );
-out count;
-
-(
+out count;""",
+    "supermarket_count": """(
   // Supermarkets
   node["shop"="supermarket"]({around});
   way["shop"="supermarket"]({around});
 );
-out count;
-
-(
+out count;""",
+    "restaurant_count": """(
   // Restaurants & fast food
   node["amenity"="restaurant"]({around});
   node["amenity"="fast_food"]({around});
   way["amenity"="restaurant"]({around});
 );
-out count;
-
-(
+out count;""",
+    "gym_count": """(
   // Gyms & fitness centres
   node["leisure"="fitness_centre"]({around});
   way["leisure"="fitness_centre"]({around});
   node["leisure"="sports_centre"]({around});
   way["leisure"="sports_centre"]({around});
 );
-out count;
-
-(
+out count;""",
+    "bar_count": """(
   // Bars & pubs
   node["amenity"="bar"]({around});
   node["amenity"="pub"]({around});
   way["amenity"="bar"]({around});
   way["amenity"="pub"]({around});
 );
-out count;
-"""
-    return query.strip()
+out count;""",
+}
+
+
+# Query builders are pure functions of (category, lat, lon, radius); the seed
+# areas only ever produce a handful of distinct strings, so they are memoized.
+QUERY_CACHE_SIZE = 128
+
+
+def _to_percent_template(template: str) -> tuple[str, int]:
+    """
+    Turn a `{around}` template into a %-style one plus its placeholder count,
+    so filling it is a single `%` with a tuple instead of a format() pass.
+    """
+    return template.replace("{around}", "%s"), template.count("{around}")
+
 
+# Query texts are fixed apart from the `around` filter, so they are assembled
+# once here and only filled per call.
+_COUNT_BLOCKS_TEMPLATE, _COUNT_BLOCKS_SLOTS = _to_percent_template(
+    "\n" + "\n\n".join(CATEGORY_QUERIES.values()) + "\n"
+)
+_CATEGORY_QUERY_TEMPLATES: dict[str, tuple[str, int]] = {
+    category: _to_percent_template(COUNT_QUERY_HEADER.format(timeout=30) + "\n" + block)
+    for category, block in CATEGORY_QUERIES.items()
+}
 
-def build_overpass_query_with_locations(lat: float, lon: float, radius: int) -> str:
-    around = f"around:{radius},{lat},{lon}"
-    query = f"""
-[out:json][timeout:30];
-// Hospitals & clinics
+
+def _count_blocks(around: str) -> str:
+    """The 8 category union blocks (each followed by `out count;`) for one area."""
+    return _COUNT_BLOCKS_TEMPLATE % ((around,) * _COUNT_BLOCKS_SLOTS)
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def build_category_query(category: str, lat: float, lon: float, radius: int) -> str:
+    """Build a count query for a single category (see CATEGORY_QUERIES)."""
+    template, slots = _CATEGORY_QUERY_TEMPLATES[category]
+    return template % ((f"around:{radius},{lat},{lon}",) * slots)
+
+
+def build_overpass_batch_query(locations: list[tuple[float, float, int]]) -> str:
+    """
+    Build ONE Overpass QL document counting all categories for several
+    (lat, lon, radius) circles. Emits the 8 count blocks per location, in
+    order, so the response holds 8 count lines per location.
+    """
+    timeout = min(30 * len(locations), 180)
+    parts = [COUNT_QUERY_HEADER.format(timeout=timeout)]
+    for i, (lat, lon, radius) in enumerate(locations):
+        parts.append(f"\n// ── Location {i}: ({lat}, {lon}) r={radius}m ──")
+        parts.append(_count_blocks(f"around:{radius},{lat},{lon}"))
+    return "".join(parts).strip()
+
+
+LOCATIONS_QUERY_HEADER = "[out:json][timeout:30];"
+
+
+# One union block per facility category, in response order. `{around}` is
+# filled with the `around:radius,lat,lon` filter.
+LOCATION_QUERIES: dict[str, str] = {
+    "hospitals": """// Hospitals & clinics
 (
   node["amenity"="hospital"]({around});
   way["amenity"="hospital"]({around});
   node["amenity"="clinic"]({around});
   way["amenity"="clinic"]({around});
 );
-out center;
-// Schools
+out center;""",
+    "schools": """// Schools
 (
   node["amenity"="school"]({around});
   way["amenity"="school"]({around});
 );
-out center;
-// Bus stops
+out center;""",
+    "bus_stops": """// Bus stops
 (
   node["highway"="bus_stop"]({around});
   node["public_transport"="platform"]["bus"="yes"]({around});
 );
-out center;
-// Metro stations
+out center;""",
+    "metro_stations": """// Metro stations
 (
   node["station"="subway"]({around});
   node["railway"="station"]({around});
   way["railway"="station"]({around});
 );
-out center;
-// Supermarkets
+out center;""",
+    "supermarkets": """// Supermarkets
 (
   node["shop"="supermarket"]({around});
   way["shop"="supermarket"]({around});
 );
-out center;
-// Restaurants
+out center;""",
+    "restaurants": """// Restaurants
 (
   node["amenity"="restaurant"]({around});
   node["amenity"="fast_food"]({around});
   way["amenity"="restaurant"]({around});
 );
-out center;
-// Gyms
+out center;""",
+    "gyms": """// Gyms
 (
   node["leisure"="fitness_centre"]({around});
   way["leisure"="fitness_centre"]({around});
   node["leisure"="sports_centre"]({around});
   way["leisure"="sports_centre"]({around});
 );
-out center;
-// Bars
+out center;""",
+    "bars": """// Bars
 (
   node["amenity"="bar"]({around});
   node["amenity"="pub"]({around});
   way["amenity"="bar"]({around});
   way["amenity"="pub"]({around});
 );
-out center;
-"""
-    return query.strip()
+out center;""",
+}
 
-
-def parse_overpass_counts(data: dict) -> dict:
+@lru_cache(maxsize=64)
+def _location_query_template(category: str, limit: int | None) -> tuple[str, int]:
     """
-    Parse the Overpass API JSON response to extract counts for each category.
-    The query uses 'out count' which returns elements with tags like 'total'.
-    Each category block returns one count element.
+    %-style template (and slot count) for a single-category locations query,
+    with `out center` capped at `limit` elements server-side.
     """
-    elements = data.get("elements", [])
+    template, slots = _to_percent_template(LOCATIONS_QUERY_HEADER + "\n" + LOCATION_QUERIES[category])
+    if limit is not None:
+        template = template.replace("out center;", f"out center {int(limit)};")
+    return template, slots
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def build_location_query(category: str, lat: float, lon: float, radius: int, limit: int | None = None) -> str:
+    """Build a facility-locations query for a single category (see LOCATION_QUERIES)."""
+    template, slots = _location_query_template(category, limit)
+    return template % ((f"around:{radius},{lat},{lon}",) * slots)
 
-    # Each 'out count' produces one element with tags.total
-    counts = []
-    for el in elements:
-        if el.get("type") == "count":
-            total = int(el.get("tags", {}).get("total", 0))
-            counts.append(total)
 
+def _counts_from_totals(totals: list[int]) -> dict:
+    """Map the 8 block totals (in query order) to count fields, padding with zeros."""
     # We expect 8 count blocks: hospitals, schools, bus_stops, metro, supermarkets, restaurants, gyms, bars
+    counts = list(totals[:8])
     while len(counts) < 8:
         counts.append(0)
 
@@ -194,6 +250,30 @@ def parse_overpass_counts(data: dict) -> dict:
     }
 
 
+def _parse_count_lines(text: str) -> list[int]:
+    """
+    Each CSV line of a count response is one block total; skip anything else.
+    Whole lines only, so numbers inside an error remark aren't read as totals.
+    """
+    return [int(line) for line in map(str.strip, text.splitlines()) if line.isdigit()]
+
+
+def parse_overpass_batch_counts(text: str, n_locations: int) -> list[dict]:
+    """
+    Parse a batched count response (see build_overpass_batch_query) into one
+    counts dict per location, in query order.
+    Raises ValueError unless the body holds exactly 8 totals per location, so
+    a truncated or error reply (e.g. a runtime-timeout remark) is retried
+    rather than read as zeros.
+    """
+    totals = _parse_count_lines(text)
+    if len(totals) != 8 * n_locations:
+        raise ValueError(
+            f"expected {8 * n_locations} count lines for {n_locations} locations, got {len(totals)}"
+        )
+    return [_counts_from_totals(totals[i * 8:(i + 1) * 8]) for i in range(n_locations)]
+
+
 OVERPASS_ENDPOINTS = [
     "https://overpass-api.de/api/interpreter",
     "https://overpass.kumi.systems/api/interpreter",
@@ -201,131 +281,278 @@ OVERPASS_ENDPOINTS = [
 ]
 
 
-async def fetch_from_overpass(lat: float, lon: float, radius: int, max_retries: int = 3) -> dict:
+# ─── In-process counts cache (sits in front of the DB cache) ───
+# Keyed by (lat, lon) rounded to ~11 m plus radius. Successful counts live for
+# CACHE_TTL_HOURS; all-zero results are negatively cached briefly so a flapping
+# API isn't hammered, and fetches that fail are not cached at all. Concurrent
+# callers for the same key share one in-flight request (singleflight).
+COUNTS_CACHE_MAX_ENTRIES = 1024
+NEGATIVE_CACHE_SECONDS = 300
+
+_counts_cache = TTLCache(maxsize=COUNTS_CACHE_MAX_ENTRIES, ttl_seconds=settings.CACHE_TTL_HOURS * 3600)
+_inflight: dict[tuple, asyncio.Task] = {}
+
+
+def _counts_cache_key(lat: float, lon: float, radius: int) -> tuple:
+    return (round(lat, 4), round(lon, 4), radius)
+
+
+def _store_counts(key: tuple, counts: dict) -> None:
+    if sum(counts.values()) > 0:
+        _counts_cache.set(key, counts)
+    else:
+        _counts_cache.set(key, counts, ttl_seconds=NEGATIVE_CACHE_SECONDS)
+
+
+async def fetch_from_overpass(
+    lat: float, lon: float, radius: int, max_retries: int = 3, use_cache: bool = True
+) -> dict:
+    """
+    Return parsed Overpass counts for a circle, served from the in-process
+    TTL cache when possible. use_cache=False skips the cache read (forced
+    refresh) but still dedupes concurrent requests and refreshes the cache.
     """
-    Make an async HTTP request to the Overpass API and return parsed counts.
-    Implements retry logic with multiple endpoints and increasing radius
-    to handle cases where the API returns all zeros.
+    key = _counts_cache_key(lat, lon, radius)
+    if use_cache:
+        hit = _counts_cache.get(key)
+        if hit is not None:
+            return dict(hit)
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_from_overpass_uncached(lat, lon, radius, max_retries))
+        _inflight[key] = task
+
+        def _on_done(t: asyncio.Task) -> None:
+            _inflight.pop(key, None)
+            if not t.cancelled() and t.exception() is None:
+                _store_counts(key, t.result())
+
+        task.add_done_callback(_on_done)
+
+    # shield: one cancelled caller must not cancel the request others await
+    return dict(await asyncio.shield(task))
+
+
+async def _fetch_category_count(category: str, endpoint: str, lat: float, lon: float, radius: int) -> int:
+    """POST a single-category count query and return its total."""
+    client = get_client()
+    response = await client.post(
+        endpoint,
+        data={"data": build_category_query(category, lat, lon, radius)},
+        timeout=60.0,
+    )
+    response.raise_for_status()
+    totals = _parse_count_lines(response.text)
+    if not totals:
+        raise ValueError(f"no count in Overpass response for {category}")
+    return totals[0]
+
+
+async def _fetch_from_overpass_uncached(lat: float, lon: float, radius: int, max_retries: int = 3) -> dict:
+    """
+    Fetch counts from the Overpass API as 8 concurrent single-category
+    requests spread across the mirrors, so latency is the slowest category
+    rather than the whole query and one stuck category can't block the rest.
+    Categories that fail are retried on the next endpoint; if any category
+    still has no count after max_retries, the last error is raised rather
+    than returning partial counts.
+    If every category succeeds but all are zero, the whole query is retried
+    with the radius increased by 500m.
     """
-    query = build_overpass_query(lat, lon, radius)
     logger.info(f"Fetching Overpass data for ({lat}, {lon}) radius={radius}m")
 
-    last_counts = None
+    categories = list(CATEGORY_QUERIES)
+    counts: dict[str, int] = {}
+    current_radius = radius
+    last_error = None
     for attempt in range(max_retries):
-        # Rotate through endpoints on retries
-        endpoint = OVERPASS_ENDPOINTS[attempt % len(OVERPASS_ENDPOINTS)]
-        current_radius = radius + (attempt * 500)  # Increase radius by 500m each retry
-        current_query = build_overpass_query(lat, lon, current_radius) if attempt > 0 else query
+        pending = [cat for cat in categories if cat not in counts]
+        # Rotate endpoints per category, shifted on every retry
+        endpoints = [
+            OVERPASS_ENDPOINTS[(i + attempt) % len(OVERPASS_ENDPOINTS)] for i in range(len(pending))
+        ]
+        results = await asyncio.gather(
+            *(
+                _fetch_category_count(cat, endpoint, lat, lon, current_radius)
+                for cat, endpoint in zip(pending, endpoints)
+            ),
+            return_exceptions=True,
+        )
 
-        try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    endpoint,
-                    data={"data": current_query},
-                )
-                response.raise_for_status()
-                data = response.json()
-
-            counts = parse_overpass_counts(data)
-            total = sum(counts.values())
-
-            if total > 0:
-                logger.info(f"Overpass counts (attempt {attempt + 1}, radius={current_radius}m): {counts}")
-                return counts
-
-            last_counts = counts
+        for cat, endpoint, result in zip(pending, endpoints, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Overpass {cat} query failed (attempt {attempt + 1}, {endpoint}): {result}")
+                last_error = result
+            else:
+                counts[cat] = result
+
+        if len(counts) < len(categories):
             logger.warning(
-                f"Overpass returned all zeros (attempt {attempt + 1}/{max_retries}, "
-                f"radius={current_radius}m, endpoint={endpoint}). Retrying..."
+                f"{len(categories) - len(counts)} Overpass categories failed "
+                f"(attempt {attempt + 1}/{max_retries}). Retrying..."
             )
+            continue
 
-        except Exception as e:
-            logger.warning(f"Overpass attempt {attempt + 1} failed ({endpoint}): {e}")
-            last_counts = last_counts or {
-                "hospital_count": 0, "school_count": 0, "bus_stop_count": 0,
-                "metro_count": 0, "supermarket_count": 0, "restaurant_count": 0,
-                "gym_count": 0, "bar_count": 0,
-            }
-
-    logger.error(f"All {max_retries} Overpass attempts returned zeros/failed for ({lat}, {lon})")
-    return last_counts or {
-        "hospital_count": 0, "school_count": 0, "bus_stop_count": 0,
-        "metro_count": 0, "supermarket_count": 0, "restaurant_count": 0,
-        "gym_count": 0, "bar_count": 0,
-    }
+        if sum(counts.values()) > 0:
+            logger.info(f"Overpass counts (attempt {attempt + 1}, radius={current_radius}m): {counts}")
+            return {cat: counts[cat] for cat in categories}
 
+        logger.warning(
+            f"Overpass returned all zeros (attempt {attempt + 1}/{max_retries}, "
+            f"radius={current_radius}m). Retrying..."
+        )
+        if attempt + 1 < max_retries:
+            counts = {}
+            current_radius += 500  # Increase radius by 500m for the next attempt
 
-async def fetch_facility_locations(lat: float, lon: float, radius: int, max_per_category: int = 50, max_retries: int = 3) -> dict:
+    if len(counts) < len(categories):
+        logger.error(f"Overpass categories still failing after {max_retries} attempts for ({lat}, {lon})")
+        raise last_error
+
+    logger.error(f"All {max_retries} Overpass attempts returned zeros for ({lat}, {lon})")
+    return _counts_from_totals([])
+
+
+async def fetch_batch_from_overpass(
+    locations: list[tuple[float, float, int]], max_retries: int = 3
+) -> list[dict]:
     """
-    Fetch facility locations for each category (nodes and ways) from Overpass.
-    Retries with multiple endpoints on error (504, connection, etc.).
-    Returns a dict of lists of FacilityLocation dicts.
+    Fetch counts for several (lat, lon, radius) circles in ONE Overpass request.
+    Rotates endpoints on failure; raises the last error if every attempt fails.
     """
-    from app.schemas.infrastructure import FacilityLocation
-    query = build_overpass_query_with_locations(lat, lon, radius)
+    query = build_overpass_batch_query(locations)
+    logger.info(f"Fetching batched Overpass data for {len(locations)} locations")
+
     last_error = None
     for attempt in range(max_retries):
         endpoint = OVERPASS_ENDPOINTS[attempt % len(OVERPASS_ENDPOINTS)]
         try:
-            async with httpx.AsyncClient(timeout=90.0) as client:
-                response = await client.post(endpoint, data={"data": query})
-                response.raise_for_status()
-                data = response.json()
-            elements = data.get("elements", [])
-            cats = {
-                "hospitals": [],
-                "schools": [],
-                "bus_stops": [],
-                "metro_stations": [],
-                "supermarkets": [],
-                "restaurants": [],
-                "gyms": [],
-                "bars": [],
-            }
-            cat_keys = list(cats.keys())
-            # Overpass returns all elements in a single list; we must split by blocks
-            # Find indices where each block starts (by Overpass 'out center' block size)
-            block_indices = []
-            block_size = len(elements) // len(cat_keys) if len(cat_keys) > 0 else 0
-            for i in range(len(cat_keys)):
-                block_indices.append(i * block_size)
-            for i, cat in enumerate(cat_keys):
-                start = block_indices[i]
-                end = block_indices[i+1] if i+1 < len(block_indices) else len(elements)
-                block = elements[start:end]
-                for el in block[:max_per_category]:
-                    # For ways, use center coordinates
-                    if el['type'] == 'way':
-                        center = el.get('center')
-                        if not center:
-                            continue
-                        lat_, lon_ = center['lat'], center['lon']
-                    else:
-                        lat_, lon_ = el['lat'], el['lon']
-                    cats[cat].append(FacilityLocation(
-                        name=el.get('tags', {}).get('name'),
-                        lat=lat_,
-                        lon=lon_,
-                        type=cat,
-                    ))
-            # Remove duplicate coordinates within each category
-            for cat in cats:
-                seen = set()
-                unique = []
-                for f in cats[cat]:
-                    key = (round(f.lat, 6), round(f.lon, 6))
-                    if key not in seen:
-                        seen.add(key)
-                        unique.append(f)
-                cats[cat] = unique
-            return cats
+            client = get_client()
+            response = await client.post(endpoint, data={"data": query}, timeout=120.0)
+            response.raise_for_status()
+            return parse_overpass_batch_counts(response.text, len(locations))
         except Exception as e:
+            logger.warning(f"Batched Overpass attempt {attempt + 1} failed ({endpoint}): {e}")
             last_error = e
-            continue
-    # If all endpoints fail, raise last error
     raise last_error
 
 
+class _AsyncByteReader:
+    """Adapt an async byte iterator to the async file-like `read()` ijson expects."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks.__aiter__()
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:  # ijson probes with read(0) to detect bytes vs str
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+def _slim_element(el: dict) -> tuple[float, float, str | None] | None:
+    """
+    Reduce an Overpass element to (lat, lon, name). Ways use their center;
+    ways without one map to None.
+    """
+    if el["type"] == "way":
+        center = el.get("center")
+        if not center:
+            return None
+        return center["lat"], center["lon"], el.get("tags", {}).get("name")
+    return el["lat"], el["lon"], el.get("tags", {}).get("name")
+
+
+def _unique_coordinate_indices(lats: list[float], lons: list[float]) -> np.ndarray:
+    """
+    Indices of the first facility at each coordinate, at 6 decimal places
+    (~0.1 m), in original order. Both scaled coordinates fit in int32, so they
+    are packed into one int64 key and de-duplicated in a single np.unique pass.
+    """
+    lat_keys = np.round(np.asarray(lats, dtype=np.float64) * 1e6).astype(np.int64)
+    lon_keys = np.round(np.asarray(lons, dtype=np.float64) * 1e6).astype(np.int64)
+    keys = (lat_keys << 32) | (lon_keys & 0xFFFFFFFF)
+    _, first_idx = np.unique(keys, return_index=True)
+    return np.sort(first_idx)
+
+
+async def _fetch_category_locations(
+    category: str, endpoint: str, lat: float, lon: float, radius: int, limit: int
+) -> list:
+    """POST a single-category locations query and return its FacilityLocation structs."""
+    from app.schemas.infrastructure import FacilityLocation
+    client = get_client()
+    query = build_location_query(category, lat, lon, radius, limit=limit)
+    # Columns rather than objects: structs are only built for unique coordinates
+    lats: list[float] = []
+    lons: list[float] = []
+    names: list[str | None] = []
+    # Stream the body and keep only (lat, lon, name) per element instead
+    # of materialising the raw bytes plus the full element/tag dicts.
+    async with client.stream("POST", endpoint, data={"data": query}, timeout=90.0) as response:
+        response.raise_for_status()
+        async for el in ijson.items_async(
+            _AsyncByteReader(response.aiter_bytes()), "elements.item", use_float=True
+        ):
+            slim = _slim_element(el)
+            if slim is None:
+                continue
+            lats.append(slim[0])
+            lons.append(slim[1])
+            names.append(slim[2])
+    if not lats:
+        return []
+    # Remove duplicate coordinates within the category
+    return [
+        FacilityLocation(name=names[i], lat=lats[i], lon=lons[i], type=category)
+        for i in _unique_coordinate_indices(lats, lons).tolist()
+    ]
+
+
+async def fetch_facility_locations(lat: float, lon: float, radius: int, max_per_category: int = 50, max_retries: int = 3) -> dict:
+    """
+    Fetch facility locations for each category (nodes and ways) from Overpass,
+    one concurrent request per category so every element is attributed to the
+    query that produced it. Categories that fail are retried on the next
+    endpoint; if any category still has no result after max_retries, the last
+    error is raised rather than returning it as an empty list.
+    Returns a dict of lists of FacilityLocation structs.
+    """
+    categories = list(LOCATION_QUERIES)
+    cats: dict[str, list] = {}
+    last_error = None
+    for attempt in range(max_retries):
+        pending = [cat for cat in categories if cat not in cats]
+        if not pending:
+            break
+        endpoints = [
+            OVERPASS_ENDPOINTS[(i + attempt) % len(OVERPASS_ENDPOINTS)] for i in range(len(pending))
+        ]
+        # Overpass stops each block at max_per_category elements, so the surplus
+        # (and its tags) never crosses the wire.
+        results = await asyncio.gather(
+            *(
+                _fetch_category_locations(cat, endpoint, lat, lon, radius, max_per_category)
+                for cat, endpoint in zip(pending, endpoints)
+            ),
+            return_exceptions=True,
+        )
+        for cat, endpoint, result in zip(pending, endpoints, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Overpass {cat} locations failed (attempt {attempt + 1}, {endpoint}): {result}")
+                last_error = result
+            else:
+                cats[cat] = result
+
+    if len(cats) < len(categories):
+        logger.error(f"Overpass location categories still failing after {max_retries} attempts for ({lat}, {lon})")
+        raise last_error
+    return {cat: cats[cat] for cat in categories}
+
+
 async def get_infrastructure_for_area(area: Area, db: Session, force_refresh: bool = False) -> InfrastructureData:
     """
     Get infrastructure data for an area, using cache if available and fresh.
@@ -334,13 +561,16 @@ async def get_infrastructure_for_area(area: Area, db: Session, force_refresh: bo
     1. Check if InfrastructureData exists for this area
     2. If exists and last_updated is within CACHE_TTL_HOURS → return cached
     3. Otherwise → fetch from Overpass API, update/create record
+
+    Load `area` with AREA_WITH_INFRASTRUCTURE so the cached row needs no
+    extra query.
     """
-    infra = db.query(InfrastructureData).filter(InfrastructureData.area_id == area.id).first()
+    infra = area.infrastructure
+    now = datetime.now(timezone.utc)
 
     # Check if cache is valid
     if infra and not force_refresh:
-        cache_expiry = infra.last_updated + timedelta(hours=settings.CACHE_TTL_HOURS)
-        if datetime.now(timezone.utc) < cache_expiry.replace(tzinfo=timezone.utc):
+        if now < infra.last_updated + _TTL:
             logger.info(f"Using cached infrastructure data for {area.name}")
             return infra
 
@@ -350,6 +580,7 @@ async def get_infrastructure_for_area(area: Area, db: Session, force_refresh: bo
             lat=area.center_lat,
             lon=area.center_lon,
             radius=area.radius_meters or 2000,
+            use_cache=not force_refresh,
         )
     except Exception as e:
         logger.error(f"Overpass API error for {area.name}: {e}")
@@ -374,15 +605,79 @@ async def get_infrastructure_for_area(area: Area, db: Session, force_refresh: bo
     if infra:
         for key, value in counts.items():
             setattr(infra, key, value)
-        infra.last_updated = datetime.now(timezone.utc)
+        infra.last_updated = now
     else:
         infra = InfrastructureData(
             area_id=area.id,
             **counts,
-            last_updated=datetime.now(timezone.utc),
+            last_updated=now,
         )
+        area.infrastructure = infra
         db.add(infra)
 
     db.commit()
     db.refresh(infra)
     return infra
+
+
+async def get_infrastructure_for_areas(
+    areas: list[Area], db: Session, force_refresh: bool = False
+) -> dict[int, InfrastructureData]:
+    """
+    Batched variant of get_infrastructure_for_area for many areas at once.
+    Loads all cached rows in one SELECT, fetches every stale/missing area in a
+    single Overpass request, and commits once. Returns {area.id: InfrastructureData}.
+    """
+    rows = db.execute(
+        select(InfrastructureData).where(InfrastructureData.area_id.in_([a.id for a in areas]))
+    ).scalars()
+    cached = {infra.area_id: infra for infra in rows}
+
+    now = datetime.now(timezone.utc)
+    result: dict[int, InfrastructureData] = {}
+    stale: list[Area] = []
+    for area in areas:
+        infra = cached.get(area.id)
+        if infra and not force_refresh and now < infra.last_updated + _TTL:
+            result[area.id] = infra
+        else:
+            stale.append(area)
+
+    if not stale:
+        return result
+
+    try:
+        batch_counts = await fetch_batch_from_overpass(
+            [(a.center_lat, a.center_lon, a.radius_meters or 2000) for a in stale]
+        )
+    except Exception as e:
+        logger.error(f"Batched Overpass API error for {len(stale)} areas: {e}")
+        batch_counts = [None] * len(stale)
+
+    for area, counts in zip(stale, batch_counts):
+        infra = cached.get(area.id)
+        if counts is None or not any(counts.values()):
+            # Failed or all-zero: keep stale cache as a fallback, otherwise
+            # store zero counts already past the TTL so the next call refetches
+            if infra:
+                result[area.id] = infra
+                continue
+            infra = InfrastructureData(area_id=area.id, **_counts_from_totals([]), last_updated=now - _TTL)
+            db.add(infra)
+            result[area.id] = infra
+            continue
+        if infra:
+            for key, value in counts.items():
+                setattr(infra, key, value)
+            infra.last_updated = now
+        else:
+            infra = InfrastructureData(area_id=area.id, **counts, last_updated=now)
+            db.add(infra)
+        result[area.id] = infra
+
+    db.commit()
+    # One SELECT refreshes every expired row instead of a lazy reload per area
+    refreshed = db.execute(
+        select(InfrastructureData).where(InfrastructureData.area_id.in_(list(result)))
+    ).scalars()
+    return {infra.area_id: infra for infra in refreshed}
@@ -9,18 +9,32 @@ Scoring steps:
 4. Compute weighted final score
 """
 
+from itertools import product
+from operator import attrgetter
+from types import MappingProxyType
+
+import numpy as np
+
 from app.models.infrastructure import InfrastructureData
 from app.models.profile import UserProfile
+from app.schemas.scoring import (
+    CategoryScores,
+    InfrastructureCounts,
+    ProfileContext,
+    ScoreBreakdown,
+    WeightsUsed,
+)
+from app.utils.cache import TTLCache
 
 
 # ─── Default weights (used when no user profile exists) ───
-DEFAULT_WEIGHTS = {
+DEFAULT_WEIGHTS = MappingProxyType({
     "transport": 0.25,
     "healthcare": 0.20,
     "education": 0.20,
     "lifestyle": 0.20,
     "grocery": 0.15,
-}
+})
 
 # ─── Normalization caps (used to scale raw scores to 0–100) ───
 # These represent the "expected max" for each raw score in a well-served area
@@ -32,6 +46,58 @@ SCORE_CAPS = {
     "grocery": 40,      # supermarket*2 → cap at 40
 }
 
+# ─── Fixed-order vector layout used by the scoring math ───
+CATEGORIES = ("transport", "healthcare", "education", "lifestyle", "grocery")
+COUNT_FIELDS = (
+    "metro_count", "bus_stop_count", "hospital_count",
+    "school_count", "restaurant_count", "supermarket_count",
+)
+
+# raw = COEFFS_ARR @ counts, rows follow CATEGORIES and columns COUNT_FIELDS
+COEFFS_ARR = np.array(
+    [
+        [5, 2, 0, 0, 0, 0],  # transport = metro*5 + bus*2
+        [0, 0, 4, 0, 0, 0],  # healthcare = hospital*4
+        [0, 0, 0, 3, 0, 0],  # education = school*3
+        [0, 0, 0, 0, 2, 0],  # lifestyle = restaurant*2
+        [0, 0, 0, 0, 0, 2],  # grocery = supermarket*2
+    ],
+    dtype=np.float64,
+)
+CAPS_ARR = np.array([SCORE_CAPS[c] for c in CATEGORIES], dtype=np.float64)
+_TRANSPORT, _HEALTHCARE, _EDUCATION, _LIFESTYLE, _GROCERY = range(len(CATEGORIES))
+
+# Read-only baseline; profile adjustments work on a copy
+_DEFAULT_WEIGHTS_ARR = np.array([DEFAULT_WEIGHTS[c] for c in CATEGORIES], dtype=np.float64)
+_DEFAULT_WEIGHTS_ARR.setflags(write=False)
+
+
+# Fetches all six counts in one C-level call instead of six attribute lookups
+_get_counts = attrgetter(*COUNT_FIELDS)
+
+
+def _counts_vector(infra: InfrastructureData) -> np.ndarray:
+    """Infrastructure counts in COUNT_FIELDS order."""
+    return np.array(_get_counts(infra), dtype=np.float64)
+
+
+def _normalized_vec(counts: np.ndarray) -> np.ndarray:
+    """
+    Raw scores scaled by CAPS_ARR to 0–100 (clamped) and rounded to 2 places.
+    Accepts one counts vector or an (N, 6) counts matrix.
+    """
+    normalized = np.minimum(counts @ COEFFS_ARR.T / CAPS_ARR * 100, 100)
+    return np.round(normalized, 2)
+
+
+def _score_vec(counts: np.ndarray, weights_arr: np.ndarray) -> tuple[np.ndarray, float]:
+    """Normalized category scores and the weighted final score for one counts vector."""
+    normalized = _normalized_vec(counts)
+    # Elementwise product + sum rather than a BLAS dot: for 5 terms NumPy sums
+    # left to right, so the rounded result matches the scalar formula exactly.
+    final = float((normalized * weights_arr).sum())
+    return normalized, round(min(final, 100), 2)
+
 
 def compute_raw_scores(infra: InfrastructureData) -> dict[str, float]:
     """
@@ -44,13 +110,7 @@ def compute_raw_scores(infra: InfrastructureData) -> dict[str, float]:
     - Lifestyle = restaurant_count * 2
     - Grocery = supermarket_count * 2
     """
-    return {
-        "transport": infra.metro_count * 5 + infra.bus_stop_count * 2,
-        "healthcare": infra.hospital_count * 4,
-        "education": infra.school_count * 3,
-        "lifestyle": infra.restaurant_count * 2,
-        "grocery": infra.supermarket_count * 2,
-    }
+    return dict(zip(CATEGORIES, (COEFFS_ARR @ _counts_vector(infra)).tolist()))
 
 
 def normalize_scores(raw: dict[str, float]) -> dict[str, float]:
@@ -66,6 +126,129 @@ def normalize_scores(raw: dict[str, float]) -> dict[str, float]:
     return normalized
 
 
+def _adj(note: str | None = None, **deltas: float) -> tuple[np.ndarray, str | None]:
+    """A weight-adjustment rule: per-category deltas (CATEGORIES order) and its note."""
+    delta = np.array([deltas.get(c, 0.0) for c in CATEGORIES], dtype=np.float64)
+    delta.setflags(write=False)
+    return delta, note
+
+
+_NO_ADJ = _adj()
+
+# Indexed by the flag value (False → 0, True → 1)
+_PARENTS_ADJ = (_NO_ADJ, _adj("Living with parents → Healthcare weight increased (+0.10)", healthcare=0.10))
+# Has elderly people → healthcare goes up
+_ELDERLY_ADJ = (_NO_ADJ, _adj("Lives with elderly → Healthcare weight increased (+0.12)", healthcare=0.12))
+# Has children → education goes up
+_CHILDREN_ADJ = (_NO_ADJ, _adj("Has children → Education weight increased (+0.10)", education=0.10))
+# Has vehicle → transport weight goes down (floored at 0.05)
+_VEHICLE_ADJ = (_NO_ADJ, _adj("Has vehicle → Transport weight decreased (-0.08)", transport=-0.08))
+
+_EMPLOYMENT_ADJ = {
+    "working": _adj("Employed (working) → Transport weight increased (+0.08)", transport=0.08),
+    "student": _adj(
+        "Student → Education weight increased (+0.05), Transport +0.03",
+        education=0.05, transport=0.03,
+    ),
+}
+_MARITAL_ADJ = {
+    "single": _adj("Single → Lifestyle weight increased (+0.08)", lifestyle=0.08),
+    "married": _adj(
+        "Married → Education weight increased (+0.08), Grocery +0.04",
+        education=0.08, grocery=0.04,
+    ),
+}
+
+
+def profile_fingerprint(profile: UserProfile) -> tuple:
+    """
+    The profile attributes that drive the weights, as a hashable key.
+    Statuses with no adjustment rule collapse to None, so the key space is
+    exactly the 2**4 * 3 * 3 states in _PROFILE_KERNELS.
+    """
+    employment = profile.employment_status
+    marital = profile.marital_status
+    return (
+        bool(profile.has_parents),
+        bool(profile.has_elderly),
+        bool(profile.has_children),
+        bool(profile.has_vehicle),
+        employment if employment in _EMPLOYMENT_ADJ else None,
+        marital if marital in _MARITAL_ADJ else None,
+    )
+
+
+def _weights_for_fingerprint(
+    has_parents: bool,
+    has_elderly: bool,
+    has_children: bool,
+    has_vehicle: bool,
+    employment_status: str | None,
+    marital_status: str | None,
+) -> tuple[np.ndarray, tuple[str, ...]]:
+    """
+    Adjust a fresh copy of the default weight vector (CATEGORIES order) for
+    one profile fingerprint and normalize it to sum to 1.0. See
+    generate_weights. Only called to build _PROFILE_KERNELS; the returned
+    array is read-only.
+    """
+    adjustments: list[str] = []
+    weights = np.empty(len(CATEGORIES), dtype=np.float64)
+    np.copyto(weights, _DEFAULT_WEIGHTS_ARR)
+
+    # ── Profile-based adjustments (table lookups, applied in rule order) ──
+    # Inactive rules contribute a zero vector, and x + 0.0 is exact, so the
+    # sums match applying each active rule one at a time.
+    rules = (
+        _PARENTS_ADJ[has_parents],
+        _ELDERLY_ADJ[has_elderly],
+        _CHILDREN_ADJ[has_children],
+        _VEHICLE_ADJ[has_vehicle],
+        _EMPLOYMENT_ADJ.get(employment_status, _NO_ADJ),
+        _MARITAL_ADJ.get(marital_status, _NO_ADJ),
+    )
+    for delta, note in rules:
+        weights += delta
+        if note:
+            adjustments.append(note)
+    # Vehicle floor; with the current defaults transport never gets near it
+    if has_vehicle and weights[_TRANSPORT] < 0.05:
+        weights[_TRANSPORT] = 0.05
+
+    # ── Normalize weights to sum to 1.0 ──
+    total = weights.sum()
+    if total > 0:
+        weights /= total
+        np.round(weights, 4, out=weights)
+
+    if not adjustments:
+        adjustments.append("Profile exists but no specific adjustments triggered")
+
+    weights.setflags(write=False)
+    return weights, tuple(adjustments)
+
+
+# Every profile state is evaluated once at import, so scoring never runs the
+# adjustment rules: a request only looks up its weight vector here.
+_PROFILE_KERNELS: dict[tuple, tuple[np.ndarray, tuple[str, ...]]] = {
+    fp: _weights_for_fingerprint(*fp)
+    for fp in product(
+        (False, True), (False, True), (False, True), (False, True),
+        (None, *_EMPLOYMENT_ADJ),
+        (None, *_MARITAL_ADJ),
+    )
+}
+
+_NO_PROFILE_ADJUSTMENTS = ("Using default weights (no profile)",)
+
+
+def _weights_vec(profile: UserProfile | None) -> tuple[np.ndarray, tuple[str, ...]]:
+    """Read-only weight vector (CATEGORIES order) and adjustment notes for a profile."""
+    if profile is None:
+        return _DEFAULT_WEIGHTS_ARR, _NO_PROFILE_ADJUSTMENTS
+    return _PROFILE_KERNELS[profile_fingerprint(profile)]
+
+
 def generate_weights(profile: UserProfile | None) -> tuple[dict[str, float], list[str]]:
     """
     Step 3: Generate weight matrix based on user profile.
@@ -80,115 +263,95 @@ def generate_weights(profile: UserProfile | None) -> tuple[dict[str, float], lis
 
     Weights are always normalized to sum to 1.0.
     """
-    adjustments: list[str] = []
+    weights, adjustments = _weights_vec(profile)
+    return dict(zip(CATEGORIES, weights.tolist())), list(adjustments)
 
-    if profile is None:
-        return DEFAULT_WEIGHTS.copy(), ["Using default weights (no profile)"]
-
-    weights = DEFAULT_WEIGHTS.copy()
-
-    # ── Profile-based adjustments ──
-    if profile.has_parents:
-        weights["healthcare"] += 0.10
-        adjustments.append("Living with parents → Healthcare weight increased (+0.10)")
-
-    # Has elderly people → healthcare goes up
-    if profile.has_elderly:
-        weights["healthcare"] += 0.12
-        adjustments.append("Lives with elderly → Healthcare weight increased (+0.12)")
-
-    # Has children → education goes up
-    if profile.has_children:
-        weights["education"] += 0.10
-        adjustments.append("Has children → Education weight increased (+0.10)")
-
-    # Has vehicle → transport weight goes down
-    if profile.has_vehicle:
-        weights["transport"] -= 0.08
-        if weights["transport"] < 0.05:
-            weights["transport"] = 0.05
-        adjustments.append("Has vehicle → Transport weight decreased (-0.08)")
-
-    if profile.employment_status == "working":
-        weights["transport"] += 0.08
-        adjustments.append("Employed (working) → Transport weight increased (+0.08)")
-    elif profile.employment_status == "student":
-        weights["education"] += 0.05
-        weights["transport"] += 0.03
-        adjustments.append("Student → Education weight increased (+0.05), Transport +0.03")
-
-    if profile.marital_status == "single":
-        weights["lifestyle"] += 0.08
-        adjustments.append("Single → Lifestyle weight increased (+0.08)")
-    elif profile.marital_status == "married":
-        weights["education"] += 0.08
-        weights["grocery"] += 0.04
-        adjustments.append("Married → Education weight increased (+0.08), Grocery +0.04")
 
-    # ── Normalize weights to sum to 1.0 ──
-    total = sum(weights.values())
-    if total > 0:
-        weights = {k: round(v / total, 4) for k, v in weights.items()}
+# ─── Score breakdown cache ───
+# compute_final_score is pure in the infra counts and the profile fields it
+# echoes back, and the same (area, profile) pair is re-scored on every page
+# view; results are cached on exactly those inputs.
+SCORE_CACHE_MAX_ENTRIES = 10_000
+SCORE_CACHE_SECONDS = 300
+_score_cache = TTLCache(maxsize=SCORE_CACHE_MAX_ENTRIES, ttl_seconds=SCORE_CACHE_SECONDS)
 
-    if not adjustments:
-        adjustments.append("Profile exists but no specific adjustments triggered")
+_INFRA_KEY_FIELDS = (
+    "hospital_count", "school_count", "bus_stop_count", "metro_count",
+    "supermarket_count", "restaurant_count", "gym_count", "bar_count",
+)
+_PROFILE_KEY_FIELDS = (
+    "marital_status", "has_parents", "employment_status", "has_vehicle",
+    "has_elderly", "has_children", "income_range",
+)
+
+
+_get_infra_key = attrgetter(*_INFRA_KEY_FIELDS)
+_get_profile_key = attrgetter(*_PROFILE_KEY_FIELDS)
 
-    return weights, adjustments
+
+def _score_cache_key(infra: InfrastructureData, profile: UserProfile | None) -> tuple:
+    if not profile:
+        return _get_infra_key(infra), None
+    return _get_infra_key(infra), _get_profile_key(profile)
 
 
 def compute_final_score(
     infra: InfrastructureData,
     profile: UserProfile | None = None,
-) -> dict:
+) -> ScoreBreakdown:
     """
     Main scoring function. Returns a complete score breakdown.
 
-    Returns dict with:
+    Returns a frozen ScoreBreakdown (shared with the score cache) with:
     - category_scores: normalized 0-100 scores per category
     - weights_used: the weight applied to each category
     - final_score: weighted sum (0-100)
     - infrastructure: raw counts
     - profile_context: how profile influenced weights (if applicable)
     """
-    # Step 1 & 2: Raw → Normalized scores
-    raw = compute_raw_scores(infra)
-    normalized = normalize_scores(raw)
+    key = _score_cache_key(infra, profile)
+    cached = _score_cache.get(key)
+    if cached is None:
+        cached = _compute_final_score(infra, profile)
+        _score_cache.set(key, cached)
+    return cached
+
 
+def _compute_final_score(infra: InfrastructureData, profile: UserProfile | None) -> ScoreBreakdown:
+    """Uncached body of compute_final_score."""
     # Step 3: Generate weights
-    weights, adjustments = generate_weights(profile)
-
-    # Step 4: Weighted final score
-    final = sum(normalized[k] * weights[k] for k in normalized)
-    final = round(min(final, 100), 2)
-
-    result = {
-        "category_scores": normalized,
-        "weights_used": weights,
-        "final_score": final,
-        "infrastructure": {
-            "hospitals": infra.hospital_count,
-            "schools": infra.school_count,
-            "bus_stops": infra.bus_stop_count,
-            "metro_stations": infra.metro_count,
-            "supermarkets": infra.supermarket_count,
-            "restaurants": infra.restaurant_count,
-            "gyms": getattr(infra, "gym_count", 0),
-            "bars": getattr(infra, "bar_count", 0),        },
-    }
+    weights_arr, adjustments = _weights_vec(profile)
+
+    # Steps 1, 2 & 4: Raw → Normalized → Weighted final score, as vector ops
+    normalized, final = _score_vec(_counts_vector(infra), weights_arr)
 
     # Add profile context if profile exists
+    profile_context = None
     if profile:
-        result["profile_context"] = {
-            "marital_status": profile.marital_status,
-            "has_parents": profile.has_parents,
-            "employment_status": profile.employment_status,
-            "has_vehicle": getattr(profile, "has_vehicle", False),
-            "has_elderly": getattr(profile, "has_elderly", False),
-            "has_children": getattr(profile, "has_children", False),
-            "income_range": getattr(profile, "income_range", None),
-            "adjustments": adjustments,
-        }
-    else:
-        result["profile_context"] = None
-
-    return result
+        profile_context = ProfileContext(
+            marital_status=profile.marital_status,
+            has_parents=profile.has_parents,
+            employment_status=profile.employment_status,
+            has_vehicle=getattr(profile, "has_vehicle", False),
+            has_elderly=getattr(profile, "has_elderly", False),
+            has_children=getattr(profile, "has_children", False),
+            income_range=getattr(profile, "income_range", None),
+            adjustments=adjustments,
+        )
+
+    return ScoreBreakdown(
+        category_scores=CategoryScores(*normalized.tolist()),
+        weights_used=WeightsUsed(*weights_arr.tolist()),
+        final_score=final,
+        infrastructure=InfrastructureCounts(
+            hospitals=infra.hospital_count,
+            schools=infra.school_count,
+            bus_stops=infra.bus_stop_count,
+            metro_stations=infra.metro_count,
+            supermarkets=infra.supermarket_count,
+            restaurants=infra.restaurant_count,
+            gyms=getattr(infra, "gym_count", 0),
+            bars=getattr(infra, "bar_count", 0),
+        ),
+        profile_context=profile_context,
+    )
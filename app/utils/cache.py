@@ -0,0 +1,69 @@
+"""
+Caching helpers: fastapi-cache key builder and a small in-process TTL cache.
+"""
+
+import time
+from collections import OrderedDict
+
+from fastapi import Request, Response
+
+
+def request_key_builder(
+    func,
+    namespace: str = "",
+    *,
+    request: Request | None = None,
+    response: Response | None = None,
+    args: tuple = (),
+    kwargs: dict | None = None,
+) -> str:
+    """
+    Key cached responses on the request path + query string only.
+    The default builder hashes every endpoint kwarg, including the injected
+    DB session, which would make every request a cache miss.
+    """
+    if request is None:
+        return f"{namespace}:{func.__module__}:{func.__name__}"
+    return f"{namespace}:{request.url.path}?{request.url.query}"
+
+
+class TTLCache:
+    """
+    Small bounded in-process cache with per-entry TTL (LRU eviction).
+    Not thread-safe; intended for use from the event loop.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key, value, ttl_seconds: float | None = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        entry = self._data.pop(key, None)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+        return entry[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
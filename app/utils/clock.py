@@ -0,0 +1,28 @@
+"""
+Time helpers shared by models and services.
+"""
+
+from datetime import datetime, timezone
+from functools import partial
+
+from sqlalchemy import DateTime
+from sqlalchemy.types import TypeDecorator
+
+# Bound once; used as the Column default factory for timestamps
+utc_now = partial(datetime.now, timezone.utc)
+
+
+class UTCDateTime(TypeDecorator):
+    """
+    DateTime(timezone=True) that always loads tz-aware UTC values.
+    Backends without timezone storage (SQLite) hand back naive datetimes;
+    those are written in UTC, so they are tagged as such on load.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_result_value(self, value, dialect):
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
@@ -0,0 +1,51 @@
+"""
+Response classes for msgspec-encoded payloads.
+"""
+
+from typing import Any
+
+import msgspec
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+_encoder = msgspec.json.Encoder()
+
+# Struct schemas referenced by msgspec_openapi_response, keyed by component
+# name; merged into the app's OpenAPI document by install_msgspec_schemas.
+_SCHEMA_REF_TEMPLATE = "#/components/schemas/{name}"
+_schema_components: dict[str, Any] = {}
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """
+    JSON response that encodes msgspec Structs (and plain JSON types) in C.
+    Subclasses JSONResponse so OpenAPI treats the body as JSON.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return _encoder.encode(content)
+
+
+def msgspec_openapi_response(struct_type: type) -> dict[int | str, dict[str, Any]]:
+    """
+    `responses=` entry documenting `struct_type` as a route's 200 JSON body.
+    Routes returning MsgspecJSONResponse have no response_model, so without
+    this OpenAPI would describe the body as a bare string.
+    """
+    (schema,), components = msgspec.json.schema_components(
+        (struct_type,), ref_template=_SCHEMA_REF_TEMPLATE
+    )
+    _schema_components.update(components)
+    return {200: {"content": {"application/json": {"schema": schema}}}}
+
+
+def install_msgspec_schemas(app: FastAPI) -> None:
+    """Add the Struct schemas registered by msgspec_openapi_response to app.openapi()."""
+    build_openapi = app.openapi
+
+    def openapi() -> dict[str, Any]:
+        schema = build_openapi()
+        schema.setdefault("components", {}).setdefault("schemas", {}).update(_schema_components)
+        return schema
+
+    app.openapi = openapi
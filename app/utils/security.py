@@ -2,67 +2,172 @@
 Security utilities: password hashing, JWT token creation/verification.
 """
 
-from datetime import datetime, timedelta, timezone
-from jose import JWTError, jwt
+import threading
+import time
+from datetime import timedelta
 import bcrypt
-from fastapi import Depends, HTTPException, status
+import jwt
+from argon2 import PasswordHasher
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only, make_transient_to_detached
 from app.config import get_settings
 from app.database import get_db
 from app.models.user import User
+from app.utils.cache import TTLCache
 
 settings = get_settings()
 
+# Token settings bound once; read on every token mint/verify
+_SECRET_KEY = settings.SECRET_KEY
+_ALGORITHM = settings.ALGORITHM
+_ALGORITHMS = [settings.ALGORITHM]
+_ACCESS_TOKEN_TTL_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
 # Bearer token security scheme
 bearer_scheme = HTTPBearer()
 
+# Columns needed to resolve a JWT to a user; password_hash and reset_token
+# are loaded lazily only by the endpoints that use them. The load_only option
+# is built per call: building it here would configure the mappers at import
+# time, before UserProfile is registered.
+_AUTH_USER_COLUMNS = (User.id, User.email, User.is_profile_completed)
+
+# Password hashing: argon2id for new hashes (~50ms on a modern core at the
+# default work factor). Legacy bcrypt hashes are still verified with bcrypt
+# directly and upgraded to argon2 on login. Work factors come from settings.
+_password_hasher = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST_KIB,
+    parallelism=1,
+)
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
 
 def hash_password(password: str) -> str:
-    """Hash a plain-text password using bcrypt directly."""
-    pwd_bytes = password.encode("utf-8")[:72]  # bcrypt max 72 bytes
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(pwd_bytes, salt).decode("utf-8")
+    """Hash a plain-text password using argon2id."""
+    return _password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain-text password against a bcrypt hash."""
+    """Verify a plain-text password against an argon2 or legacy bcrypt hash."""
     try:
-        pwd_bytes = plain_password.encode("utf-8")[:72]
-        hash_bytes = hashed_password.encode("utf-8")
-        return bcrypt.checkpw(pwd_bytes, hash_bytes)
+        if hashed_password.startswith(_BCRYPT_PREFIXES):
+            pwd_bytes = plain_password.encode("utf-8")[:72]  # bcrypt max 72 bytes
+            return bcrypt.checkpw(pwd_bytes, hashed_password.encode("utf-8"))
+        return _password_hasher.verify(hashed_password, plain_password)
     except Exception:
         return False
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """
+    Verify a password and, if the stored hash is legacy bcrypt or argon2 with
+    outdated parameters, return a fresh hash to persist (else None).
+    """
+    if not verify_password(plain_password, hashed_password):
+        return False, None
+    if hashed_password.startswith(_BCRYPT_PREFIXES) or _password_hasher.check_needs_rehash(hashed_password):
+        return True, hash_password(plain_password)
+    return True, None
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """
     Create a JWT access token.
     Encodes user data with an expiration time.
     """
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    ttl = int(expires_delta.total_seconds()) if expires_delta else _ACCESS_TOKEN_TTL_SECONDS
+    # Numeric `exp` (seconds since epoch), as the JWT spec allows
+    to_encode["exp"] = int(time.time()) + ttl
+    return jwt.encode(to_encode, _SECRET_KEY, algorithm=_ALGORITHM)
+
+
+# Verified payloads by raw token, so a session's repeated requests skip the
+# signature check. Entries never outlive the token's own `exp`. The auth
+# dependencies run on threadpool threads, hence the lock.
+TOKEN_CACHE_MAX_ENTRIES = 50_000
+TOKEN_CACHE_SECONDS = 60
+_token_cache = TTLCache(maxsize=TOKEN_CACHE_MAX_ENTRIES, ttl_seconds=TOKEN_CACHE_SECONDS)
+_token_cache_lock = threading.Lock()
 
 
 def decode_token(token: str) -> dict | None:
     """Decode and validate a JWT token. Returns payload or None."""
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+    if cached is not None:
+        return dict(cached)
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
+        payload = jwt.decode(token, _SECRET_KEY, algorithms=_ALGORITHMS)
+    except jwt.PyJWTError:
         return None
+    ttl = TOKEN_CACHE_SECONDS
+    exp = payload.get("exp")
+    if exp is not None:
+        ttl = min(ttl, exp - time.time())
+    if ttl > 0:
+        with _token_cache_lock:
+            _token_cache.set(token, payload, ttl_seconds=ttl)
+    return dict(payload)
+
+
+# Auth columns of recently seen users by id, so authenticated requests skip
+# the user SELECT. Call invalidate_cached_user after changing any of them.
+USER_CACHE_MAX_ENTRIES = 10_000
+USER_CACHE_SECONDS = 30
+_user_cache = TTLCache(maxsize=USER_CACHE_MAX_ENTRIES, ttl_seconds=USER_CACHE_SECONDS)
+_user_cache_lock = threading.Lock()
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """Drop a user's cached auth columns (after is_profile_completed/email change)."""
+    with _user_cache_lock:
+        _user_cache.pop(user_id)
+
+
+def _load_auth_user(db: Session, user_id: int) -> User | None:
+    """
+    Resolve a token's user id to a session-bound User with the auth columns
+    loaded. Served from the user cache when possible: the cached columns are
+    attached to the session with merge(load=False), which emits no SQL, and
+    any other column lazy-loads on first access as usual.
+    """
+    with _user_cache_lock:
+        snapshot = _user_cache.get(user_id)
+    if snapshot is not None:
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+    # Session.get checks the identity map before emitting any SQL
+    user = db.get(User, user_id, options=[load_only(*_AUTH_USER_COLUMNS)])
+    if user is not None:
+        with _user_cache_lock:
+            _user_cache.set(user_id, {
+                "id": user.id,
+                "email": user.email,
+                "is_profile_completed": user.is_profile_completed,
+            })
+    return user
 
 
 def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     db: Session = Depends(get_db),
 ) -> User:
     """
     FastAPI dependency: extracts and validates the JWT from Authorization header,
     then returns the authenticated User object.
+    The user is memoized on request.state so repeated resolutions within one
+    request skip the JWT decode and the DB lookup.
     """
+    cached = getattr(request.state, "user", None)
+    if cached is not None:
+        return cached
+
     token = credentials.credentials
     payload = decode_token(token)
     if payload is None:
@@ -72,21 +177,27 @@ def get_current_user(
     if user_id is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    user = _load_auth_user(db, int(user_id))
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
 
+    request.state.user = user
     return user
 
 
 def get_optional_user(
+    request: Request,
     db: Session = Depends(get_db),
     credentials: HTTPAuthorizationCredentials | None = Depends(HTTPBearer(auto_error=False)),
 ) -> User | None:
     """
     FastAPI dependency: optionally extracts user from JWT.
     Returns None if no token is provided (for unauthenticated score access).
+    Shares the request.state memo with get_current_user.
     """
+    cached = getattr(request.state, "user", None)
+    if cached is not None:
+        return cached
     if credentials is None:
         return None
     payload = decode_token(credentials.credentials)
@@ -95,4 +206,7 @@ def get_optional_user(
     user_id = payload.get("sub")
     if user_id is None:
         return None
-    return db.query(User).filter(User.id == int(user_id)).first()
+    user = _load_auth_user(db, int(user_id))
+    if user is not None:
+        request.state.user = user
+    return user
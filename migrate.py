@@ -7,40 +7,98 @@ import os
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "avenir.db")
 
+# Bump when adding steps below; stored in PRAGMA user_version once applied
+SCHEMA_VERSION = 1
+
+def _existing_columns(c, table):
+    """Column names of a table (empty if the table does not exist)."""
+    return {row[1] for row in c.execute(f"PRAGMA table_info({table})")}
+
+
+def _add_columns(c, table, cols):
+    """Add missing columns; returns False if the table does not exist."""
+    existing = _existing_columns(c, table)
+    if not existing:
+        print(f"  ~ Skipping {table}: table does not exist")
+        return False
+    for col_name, col_type in cols:
+        if col_name in existing:
+            print(f"  ~ Skipping {table}.{col_name}: already exists")
+            continue
+        c.execute(f"ALTER TABLE {table} ADD COLUMN {col_name} {col_type}")
+        print(f"  + Added {col_name} to {table}")
+    return True
+
+
+def _user_version(c):
+    return c.execute("PRAGMA user_version").fetchone()[0]
+
+
 def migrate():
-    conn = sqlite3.connect(DB_PATH)
+    # Autocommit mode so the transaction below is controlled explicitly;
+    # sqlite3 would otherwise commit each ALTER TABLE on its own.
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
     c = conn.cursor()
 
-    # --- user_profiles ---
-    profile_cols = [
-        ("income_range", "VARCHAR(40) DEFAULT 'prefer_not_to_say'"),
-        ("additional_info", "TEXT"),
-        ("has_vehicle", "BOOLEAN DEFAULT 0"),
-        ("has_elderly", "BOOLEAN DEFAULT 0"),
-        ("has_children", "BOOLEAN DEFAULT 0"),
-        ("profile_picture", "TEXT"),
-    ]
-    for col_name, col_type in profile_cols:
-        try:
-            c.execute(f"ALTER TABLE user_profiles ADD COLUMN {col_name} {col_type}")
-            print(f"  + Added {col_name} to user_profiles")
-        except Exception as e:
-            print(f"  ~ Skipping user_profiles.{col_name}: {e}")
-
-    # --- infrastructure_data ---
-    infra_cols = [
-        ("gym_count", "INTEGER DEFAULT 0"),
-        ("bar_count", "INTEGER DEFAULT 0"),
-    ]
-    for col_name, col_type in infra_cols:
-        try:
-            c.execute(f"ALTER TABLE infrastructure_data ADD COLUMN {col_name} {col_type}")
-            print(f"  + Added {col_name} to infrastructure_data")
-        except Exception as e:
-            print(f"  ~ Skipping infrastructure_data.{col_name}: {e}")
-
-    conn.commit()
-    conn.close()
+    if _user_version(c) >= SCHEMA_VERSION:
+        conn.close()
+        print(f"Schema already at version {SCHEMA_VERSION}, nothing to do.")
+        return
+
+    # journal_mode cannot change inside a transaction; WAL also persists for the app
+    c.execute("PRAGMA journal_mode=WAL")
+    c.execute("PRAGMA synchronous=NORMAL")
+    c.execute("PRAGMA temp_store=MEMORY")
+
+    # IMMEDIATE takes the write lock up front, so concurrently starting
+    # workers run the steps one at a time and later ones see the new version.
+    c.execute("BEGIN IMMEDIATE")
+    try:
+        if _user_version(c) >= SCHEMA_VERSION:
+            c.execute("COMMIT")
+            print(f"Schema already at version {SCHEMA_VERSION}, nothing to do.")
+            return
+
+        # --- user_profiles ---
+        complete = _add_columns(c, "user_profiles", [
+            ("income_range", "VARCHAR(40) DEFAULT 'prefer_not_to_say'"),
+            ("additional_info", "TEXT"),
+            ("has_vehicle", "BOOLEAN DEFAULT 0"),
+            ("has_elderly", "BOOLEAN DEFAULT 0"),
+            ("has_children", "BOOLEAN DEFAULT 0"),
+            ("profile_picture", "TEXT"),
+        ])
+
+        # --- infrastructure_data ---
+        complete &= _add_columns(c, "infrastructure_data", [
+            ("gym_count", "INTEGER DEFAULT 0"),
+            ("bar_count", "INTEGER DEFAULT 0"),
+        ])
+
+        # --- indexes ---
+        indexes = [
+            ("ix_users_reset_token", "users", "reset_token"),
+            ("ix_user_profiles_user_id", "user_profiles", "user_id"),
+        ]
+        for index_name, table, column in indexes:
+            try:
+                c.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {index_name} ON {table} ({column})")
+                print(f"  + Ensured index {index_name} on {table}.{column}")
+            except sqlite3.Error as e:
+                # A failed statement is rolled back on its own; the transaction stays open
+                print(f"  ~ Skipping index {index_name}: {e}")
+                complete = False
+
+        # Only record the version once every step applied, so a partial run
+        # (e.g. tables not created yet) is retried next time.
+        if complete:
+            c.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        c.execute("COMMIT")
+    except Exception:
+        c.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
     print("\nMigration complete!")
 
 if __name__ == "__main__":